@@ -0,0 +1,31 @@
+# type: ignore
+import pytest
+
+import rwrapr as wr
+
+
+@pytest.fixture(scope="module")
+def identity(bs):
+    return bs.identity
+
+
+def test_call_rpy2(benchmark, identity):
+    # baseline, the R function called through rpy2 without any conversion
+    arg = identity.call_r(1)
+    benchmark(identity.func, arg)
+
+
+def test_call(benchmark, identity):
+    benchmark(identity, 1)
+
+
+def test_call_r(benchmark, identity):
+    benchmark(identity.call_r, 1)
+
+
+def test_call_keep(benchmark, identity):
+    benchmark(identity.keep, 1)
+
+
+def test_call_lazily(benchmark, bs):
+    benchmark(bs.sum, 1, 2, na_rm=wr.Lazily("TRUE"))
@@ -0,0 +1,69 @@
+# type: ignore
+import numpy as np
+import pytest
+
+import rwrapr as wr
+from rwrapr.convert_py2r import convert_py2r
+from rwrapr.convert_r2py import convert_r2py
+
+
+SIZES = [10**2, 10**4, 10**6, 10**7]
+DTYPES = ["float64", "int32", "bool", "str"]
+SHAPES = [(10**6,), (1000, 1000), (100, 100, 100)]
+
+
+def make_array(rng, dtype, shape):
+    match dtype:
+        case "float64":
+            return rng.standard_normal(shape)
+        case "int32":
+            return rng.integers(-1000, 1000, shape, dtype=np.int32)
+        case "bool":
+            return rng.random(shape) > 0.5
+        case "str":
+            return np.char.mod("s%d", rng.integers(0, 1000, shape))
+
+
+def skip_large_strings(dtype, size):
+    if dtype == "str" and size > 10**6:
+        pytest.skip("string vectors are benchmarked up to 1e6 elements")
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_py2r_1d(benchmark, rng, dtype, size):
+    skip_large_strings(dtype, size)
+    x = make_array(rng, dtype, size)
+    benchmark(convert_py2r, x)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("dtype", DTYPES)
+@pytest.mark.parametrize("zero_copy", [False, True])
+def test_r2py_1d(benchmark, rng, dtype, size, zero_copy):
+    skip_large_strings(dtype, size)
+    r_object = convert_py2r(make_array(rng, dtype, size))
+    with wr.settings.override(zero_copy=zero_copy):
+        benchmark(convert_r2py, r_object)
+
+
+@pytest.mark.parametrize("shape", SHAPES, ids=["1d", "2d", "3d"])
+@pytest.mark.parametrize("dtype", ["float64", "int32"])
+def test_py2r_shapes(benchmark, rng, dtype, shape):
+    x = make_array(rng, dtype, shape)
+    benchmark(convert_py2r, x)
+
+
+@pytest.mark.parametrize("shape", SHAPES, ids=["1d", "2d", "3d"])
+@pytest.mark.parametrize("dtype", ["float64", "int32"])
+@pytest.mark.parametrize("zero_copy", [False, True])
+def test_r2py_shapes(benchmark, rng, dtype, shape, zero_copy):
+    r_object = convert_py2r(make_array(rng, dtype, shape))
+    with wr.settings.override(zero_copy=zero_copy):
+        benchmark(convert_r2py, r_object)
+
+
+@pytest.mark.parametrize("size", [10**2, 10**4, 10**5])
+def test_py2r_list(benchmark, size):
+    x = list(range(size))
+    benchmark(convert_py2r, x)
@@ -0,0 +1,26 @@
+# type: ignore
+import pytest
+
+import rwrapr as wr
+from rwrapr.convert_r2py import convert_r2py
+
+
+NESTED_LIST = """
+function(n) lapply(seq_len(n), function(i) {
+    list(id = i, name = letters[1 + i %% 26], values = c(i, i / 2), meta = list(ok = TRUE))
+})
+"""
+
+
+@pytest.mark.parametrize("size", [10**2, 10**4])
+@pytest.mark.parametrize("lazy_lists", [False, True])
+def test_nested_list_r2py(benchmark, bs, size, lazy_lists):
+    r_object = bs.function(NESTED_LIST).call_r(size)
+    with wr.settings.override(lazy_lists=lazy_lists):
+        benchmark(convert_r2py, r_object)
+
+
+@pytest.mark.parametrize("size", [10**2, 10**4])
+def test_nested_list_call(benchmark, bs, size):
+    nested_list = bs.function(NESTED_LIST)
+    benchmark(nested_list, size)
@@ -0,0 +1,46 @@
+# type: ignore
+import numpy as np
+import pandas as pd
+import pytest
+
+import rwrapr as wr
+from rwrapr.rdataframe import pandas2r
+from rwrapr.rdataframe import r2pandas
+
+
+def make_frame(rng, nrow, ncol):
+    # numeric, string and categorical columns, in equal numbers
+    columns = {}
+    for i in range(ncol):
+        match i % 4:
+            case 0:
+                columns[f"f{i}"] = rng.standard_normal(nrow)
+            case 1:
+                columns[f"i{i}"] = rng.integers(0, 1000, nrow, dtype=np.int32)
+            case 2:
+                columns[f"s{i}"] = np.char.mod("s%d", rng.integers(0, 1000, nrow))
+            case 3:
+                columns[f"c{i}"] = pd.Categorical.from_codes(
+                    rng.integers(0, 26, nrow),
+                    categories=list("abcdefghijklmnopqrstuvwxyz"),
+                )
+    return pd.DataFrame(columns)
+
+
+FRAMES = {"long": (10**6, 4), "wide": (100, 2000)}
+
+
+@pytest.mark.parametrize("frame", FRAMES)
+@pytest.mark.parametrize("arrow_transfer", [False, True])
+def test_pandas2r(benchmark, rng, frame, arrow_transfer):
+    df = make_frame(rng, *FRAMES[frame])
+    with wr.settings.override(arrow_transfer=arrow_transfer):
+        benchmark(pandas2r, df)
+
+
+@pytest.mark.parametrize("frame", FRAMES)
+@pytest.mark.parametrize("arrow_transfer", [False, True])
+def test_r2pandas(benchmark, rng, frame, arrow_transfer):
+    rdf = pandas2r(make_frame(rng, *FRAMES[frame]))
+    with wr.settings.override(arrow_transfer=arrow_transfer):
+        benchmark(r2pandas, rdf)
@@ -0,0 +1,41 @@
+# type: ignore
+import os
+import subprocess
+import sys
+
+import pytest
+
+import rwrapr as wr
+
+
+START_RENV = (
+    "import rwrapr as wr; wr.settings.set_manifest_cache(True); "
+    "wr.library('stats', interactive=False)"
+)
+
+
+def start_renv(cache_dir):
+    # a new process, as a package can not be unloaded from the embedded R
+    env = os.environ | {"RWRAPR_CACHE_DIR": str(cache_dir)}
+    subprocess.run([sys.executable, "-c", START_RENV], env=env, check=True)
+
+
+def test_renv_cold_start(benchmark, tmp_path):
+    runs = iter(range(1_000_000))
+
+    def empty_cache_dir():
+        return (tmp_path / str(next(runs)),), {}
+
+    benchmark.pedantic(start_renv, setup=empty_cache_dir, rounds=5)
+
+
+def test_renv_warm_start(benchmark, tmp_path):
+    start_renv(tmp_path)  # writes the manifest
+    benchmark.pedantic(start_renv, args=(tmp_path,), rounds=5)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_renv_in_process(benchmark, lazy):
+    # the package is already loaded in R, only the Python side is measured
+    wr.library("stats", interactive=False)
+    benchmark(wr.Renv, "stats", interactive=False, lazy=lazy)
@@ -0,0 +1,38 @@
+# type: ignore
+import pytest
+import scipy
+
+from rwrapr.convert_py2r import convert_py2r
+from rwrapr.convert_r2py import convert_r2py
+
+
+SHAPES = {"small": (1000, 100), "large": (100_000, 1000)}
+
+
+def make_sparse(shape):
+    return scipy.sparse.random(*shape, density=0.01, format="csc", random_state=2024)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def matrix_package():
+    import rwrapr as wr
+
+    wr.library("Matrix", interactive=False)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_sparse_py2r(benchmark, shape):
+    x = make_sparse(SHAPES[shape])
+    benchmark(convert_py2r, x)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_sparse_r2py(benchmark, shape):
+    r_object = convert_py2r(make_sparse(SHAPES[shape]))
+    benchmark(convert_r2py, r_object)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_sparse_roundtrip(benchmark, shape):
+    x = make_sparse(SHAPES[shape])
+    benchmark(lambda: convert_r2py(convert_py2r(x)))
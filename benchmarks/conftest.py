@@ -0,0 +1,15 @@
+# type: ignore
+import numpy as np
+import pytest
+
+import rwrapr as wr
+
+
+@pytest.fixture(scope="session")
+def bs():
+    return wr.library("base", interactive=False)
+
+
+@pytest.fixture(scope="session")
+def rng():
+    return np.random.default_rng(2024)
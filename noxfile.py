@@ -172,6 +172,23 @@ def tests(session: Session) -> None:
             session.notify("coverage", posargs=[])
 
 
+@session(python=python_versions[0])
+def benchmarks(session: Session) -> None:
+    """Run the benchmarks, and save the results as JSON in .benchmarks."""
+    session.install(".")
+    session.install("pytest", "pytest-benchmark")
+    session.run(
+        "pytest",
+        "benchmarks",
+        "-o",
+        "pythonpath=",
+        "-o",
+        "python_files=bench_*.py",
+        "--benchmark-autosave",
+        *session.posargs,
+    )
+
+
 @session(python=python_versions[0])
 def coverage(session: Session) -> None:
     """Produce the coverage report."""
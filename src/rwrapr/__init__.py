@@ -5,35 +5,73 @@ import warnings
 
 warnings.simplefilter("always")
 
+from .aio import AsyncRenv
+from .aio import RExecutor
+from .argcache import ArgCache
+from .function_wrapper import RFunction
 from .lazy_rexpr import Lazily
 from .library import importr
 from .library import library
 from .load_namespace import try_load_namespace
 from .rarray import RArray
+from .rcache import Memoize
+from .rcache import RCallCache
 from .rdataframe import RDataFrame
 from .renv import Renv
 from .rfactor import RFactor
+from .rlist import LazyRDict
+from .rlist import LazyRList
 from .rlist import RDict
 from .rlist import RList
+from .rpool import RFuture
+from .rpool import RWorkerPool
 from .rview import RView
+from .sparse import RSparseArray
 from .settings import Settings
 from .settings import settings
 from .toggle_rview import ToggleRView
+from .tracing import CallTrace
+from .tracing import OpenTelemetrySink
+from .tracing import add_sink
+from .tracing import disable_stats
+from .tracing import enable_stats
+from .tracing import remove_sink
+from .tracing import stats
+from .tracing import trace_calls
 
 
 __all__ = [
+    "ArgCache",
+    "AsyncRenv",
+    "CallTrace",
     "Lazily",
+    "LazyRDict",
+    "LazyRList",
+    "Memoize",
+    "OpenTelemetrySink",
     "RArray",
+    "RCallCache",
     "RDataFrame",
     "RDict",
+    "RExecutor",
     "RFactor",
+    "RFunction",
+    "RFuture",
     "RList",
+    "RSparseArray",
     "RView",
+    "RWorkerPool",
     "Renv",
     "Settings",
     "ToggleRView",
+    "add_sink",
+    "disable_stats",
+    "enable_stats",
     "importr",
     "library",
+    "remove_sink",
     "settings",
+    "stats",
+    "trace_calls",
     "try_load_namespace",
 ]
@@ -0,0 +1,209 @@
+# asyncio interface to R. The embedded R is not thread-safe, so all R work
+# (including the conversion of arguments and results) is run on a single
+# dedicated thread, which takes calls from a bounded queue.
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import queue
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+
+class RExecutor:
+    """
+    Runs calls one at a time on a dedicated R thread.
+
+    Each call runs in a copy of the context it was submitted from, such that
+    settings overrides (see `Settings.override`) of the caller apply.
+
+    The number of pending calls is bounded, for calls from threads (`submit`)
+    and for calls from each event loop (`run`). When the bound is reached,
+    `submit` blocks and `run` waits (without blocking the event loop) until a
+    call is completed, such that producers are slowed down to the speed of R.
+    Calls which are still queued can be cancelled, running calls are completed.
+
+    While the executor is in use, R should not be called from other threads.
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        """
+        Initializes the executor, and starts the R thread.
+
+        Args:
+            maxsize (int): The maximum number of pending calls, from threads and from
+                each event loop. Defaults to 64.
+        """
+        self.maxsize = maxsize
+        self._slots = threading.BoundedSemaphore(maxsize)
+        self._loop_slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self.queue: queue.Queue[
+            tuple[
+                Future[Any],
+                contextvars.Context,
+                Callable[..., Any],
+                tuple[Any, ...],
+                dict[str, Any],
+            ]
+            | None
+        ] = queue.Queue()
+        self.thread = threading.Thread(
+            target=self._worker, name="rwrapr-r-thread", daemon=True
+        )
+        self.thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+
+            future, context, func, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue  # cancelled while queued
+            try:
+                # run in the context of the caller, such that settings overrides apply
+                future.set_result(context.run(func, *args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(
+        self, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        """
+        Queues a call, blocking while `maxsize` calls from threads are pending.
+
+        Args:
+            func (Callable[..., Any]): The function to call on the R thread.
+            *args (Any): Positional arguments passed to `func`.
+            **kwargs (Any): Keyword arguments passed to `func`.
+
+        Returns:
+            Future[Any]: The future result of the call.
+        """
+        self._slots.acquire()
+        future: Future[Any] = Future()
+        future.add_done_callback(lambda _: self._slots.release())
+        context = contextvars.copy_context()
+        self.queue.put_nowait((future, context, func, args, kwargs))
+        return future
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Queues a call and awaits its result.
+
+        If the awaiting task is cancelled while the call is queued, the call is cancelled.
+
+        Args:
+            func (Callable[..., Any]): The function to call on the R thread.
+            *args (Any): Positional arguments passed to `func`.
+            **kwargs (Any): Keyword arguments passed to `func`.
+
+        Returns:
+            Any: The result of the call.
+        """
+        loop = asyncio.get_running_loop()
+        slots = self._loop_slots.get(loop)
+        if slots is None:
+            slots = self._loop_slots[loop] = asyncio.Semaphore(self.maxsize)
+        await slots.acquire()
+
+        def release(_: Future[Any]) -> None:
+            # called on the R thread, or on the loop if cancelled while queued
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(slots.release)
+
+        future: Future[Any] = Future()
+        future.add_done_callback(release)
+        context = contextvars.copy_context()
+        self.queue.put_nowait((future, context, func, args, kwargs))
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.cancel()  # if still queued, the call is skipped
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the R thread, after the queued calls are completed.
+
+        Args:
+            wait (bool): If True, waits for the R thread to stop. Defaults to True.
+        """
+        self.queue.put(None)
+        if wait:
+            self.thread.join()
+
+
+_executor: RExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> RExecutor:
+    # The executor shared by RFunction.acall and AsyncRenv, started on first use
+    global _executor
+    with _executor_lock:
+        if _executor is None or not _executor.thread.is_alive():
+            _executor = RExecutor()
+        return _executor
+
+
+class AsyncRenv:
+    """
+    An asyncio interface to an `Renv`.
+
+    Functions are accessed as attributes, and are awaited, e.g.,
+    `await AsyncRenv(renv).sum(1, 2)`. All R work is run on the R thread of the executor.
+    """
+
+    def __init__(self, renv: Any, executor: RExecutor | None = None) -> None:
+        """
+        Initializes the AsyncRenv.
+
+        Args:
+            renv (Renv): The R environment.
+            executor (RExecutor | None): The executor running the calls. Defaults to
+                the executor shared with `RFunction.acall`.
+        """
+        self.renv = renv
+        self.executor = executor if executor is not None else get_executor()
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        async def acall(*args: Any, **kwargs: Any) -> Any:
+            # the attribute is looked up on the R thread, as it may load the function
+            return await self.executor.run(
+                lambda: getattr(self.renv, name)(*args, **kwargs)
+            )
+
+        acall.__name__ = name
+        return acall
+
+    async def reval(self, expr: str, rview: bool | None = None) -> Any:
+        """
+        Evaluates an R expression, see `Renv.reval`.
+
+        Args:
+            expr (str): The R expression to evaluate.
+            rview (bool | None): If True, returns the result as an RView object. Defaults to None.
+
+        Returns:
+            Any: The result of the R expression.
+        """
+        return await self.executor.run(self.renv.reval, expr, rview=rview)
+
+    async def dataset(self, name: str) -> Any:
+        """
+        Gets a dataset (or any other attribute) of the R environment.
+
+        Args:
+            name (str): The name of the dataset.
+
+        Returns:
+            Any: The dataset.
+        """
+        return await self.executor.run(getattr, self.renv, name)
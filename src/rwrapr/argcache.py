@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from .convert_py2r import convert_py2r
+
+
+class ArgCache:
+    """
+    A cache of converted arguments, reusing the R object when the same large
+    DataFrame or array is passed to R functions repeatedly.
+
+    Entries are keyed on the identity of the Python object, and are reused
+    only while a fingerprint of the object (its shape, dtypes, labels and a
+    hash of its content) is unchanged, such that modified objects are
+    converted again. Entries are dropped when the Python object is garbage
+    collected, or when the cache is full (least recently used first).
+
+    Only plain `pd.DataFrame` and `np.ndarray` objects (not subclasses, or
+    arrays of python objects) of at least `min_nbytes` bytes are cached.
+
+    Attributes:
+        maxsize (int): The maximum number of cached arguments.
+        min_nbytes (int): The minimum size of cached arguments.
+        hits (int): The number of conversions answered from the cache.
+        misses (int): The number of cacheable arguments converted.
+    """
+
+    def __init__(self, maxsize: int = 8, min_nbytes: int = 1024**2) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of cached arguments. Defaults to 8.
+            min_nbytes (int): The minimum size (in bytes) of cached arguments,
+                smaller arguments are always converted. Defaults to 1 MiB.
+        """
+        self.maxsize = maxsize
+        self.min_nbytes = min_nbytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[int, tuple[weakref.ref[Any], Hashable, Any]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def convert(self, x: Any) -> Any:
+        """
+        Converts an argument to R, reusing the R object of an earlier conversion if possible.
+
+        Args:
+            x (Any): The argument.
+
+        Returns:
+            Any: The argument converted to R.
+        """
+        fingerprint = self.fingerprint(x)
+        if fingerprint is None:
+            return convert_py2r(x)
+
+        key = id(x)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is x and entry[1] == fingerprint:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+        self.misses += 1
+        r_object = convert_py2r(x)
+        ref = weakref.ref(x, functools.partial(self._discard, key))
+        self._entries[key] = (ref, fingerprint, r_object)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return r_object
+
+    def fingerprint(self, x: Any) -> Hashable | None:
+        """
+        Computes the fingerprint of an argument.
+
+        Args:
+            x (Any): The argument.
+
+        Returns:
+            Hashable | None: The fingerprint, or None if the argument is not cached.
+        """
+        try:
+            if type(x) is np.ndarray:
+                if x.dtype.hasobject or x.nbytes < self.min_nbytes:
+                    return None
+                content = np.ascontiguousarray(x).view(np.uint8)
+                return (x.shape, x.dtype.str, hash_bytes(content))
+
+            if type(x) is pd.DataFrame:
+                if x.memory_usage(index=True, deep=False).sum() < self.min_nbytes:
+                    return None
+                hashes = pd.util.hash_pandas_object(x, index=True).to_numpy()
+                return (
+                    x.shape,
+                    tuple(str(dtype) for dtype in x.dtypes),
+                    tuple(x.columns),
+                    tuple(x.index.names),
+                    hash_bytes(hashes),
+                )
+        except TypeError:  # e.g., unhashable values in object columns
+            return None
+
+        return None
+
+    def clear(self) -> None:
+        """Removes all cached arguments."""
+        self._entries.clear()
+
+    def _discard(self, key: int, ref: weakref.ref[Any]) -> None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is ref:
+            del self._entries[key]
+
+
+def hash_bytes(x: NDArray[Any]) -> str:
+    # x must be C-contiguous
+    return hashlib.blake2b(x.data, digest_size=16).hexdigest()
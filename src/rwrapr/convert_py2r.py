@@ -11,8 +11,10 @@ import scipy  # type: ignore
 from .rlist import RDict
 from .rlist import RList
 from .rlist import dict2rlist
-from .rlist import pylist2rlist
+from .rlist import pylist2rvector
 from .rview import RView
+from .settings import settings
+from .sparse import RSparseArray
 from .sparse import convert_pysparsematrix
 
 
@@ -33,10 +35,12 @@ PyDtype: TypeAlias = int | bool | str | float
 
 # functions for converting from py 2 R -----------------------------------------
 def convert_py_args2r(args: list[Any], kwargs: dict[str, Any]) -> None:
+    arg_cache = settings.arg_cache
+    convert = arg_cache.convert if arg_cache is not None else convert_py2r
     for i, x in enumerate(args):
-        args[i] = convert_py2r(x)
+        args[i] = convert(x)
     for k, v in kwargs.items():
-        kwargs[k] = convert_py2r(v)
+        kwargs[k] = convert(v)
 
 
 def convert_py2r(x: Any) -> RBaseObject | PyDtype | Any:
@@ -46,9 +50,18 @@ def convert_py2r(x: Any) -> RBaseObject | PyDtype | Any:
     from .rdataframe import RDataFrame
     from .rdataframe import pandas2r
     from .rfactor import RFactor
+    from .rfactor import convert_categorical2r
 
     match x:
-        case RView() | RArray() | RList() | RDataFrame() | RDict() | RFactor():
+        case (
+            RView()
+            | RArray()
+            | RList()
+            | RDataFrame()
+            | RDict()
+            | RFactor()
+            | RSparseArray()
+        ):
             return x.to_r()
         case _ if x is np.nan:
             return (
@@ -56,16 +69,18 @@ def convert_py2r(x: Any) -> RBaseObject | PyDtype | Any:
             )  # this should probably be reconsidered at some point (see line 35 in renv.py)
         case np.ndarray():
             return convert_numpy2r(x)
-        case scipy.sparse.coo_array() | scipy.sparse.coo_matrix():
+        case _ if scipy.sparse.issparse(x):
             return convert_pysparsematrix(x)
         case OrderedDict() | dict():
             return dict2rlist(x)
         case list() | tuple() | set():
-            return pylist2rlist(x)
+            return pylist2rvector(x)
         case pd.DataFrame():
             return pandas2r(x)
         case pd.Categorical():
-            return ro.FactorVector(x)
+            return convert_categorical2r(x)
+        case pd.Series() if isinstance(x.dtype, pd.CategoricalDtype):
+            return convert_categorical2r(x)
         case pd.Series():
             return convert_py2r(x.to_numpy())
         case NoneType():
@@ -1,4 +1,6 @@
+from collections.abc import Callable
 from typing import Any
+from typing import TypeAlias
 
 import numpy as np
 import pandas as pd
@@ -6,6 +8,7 @@ import rpy2.rlike.container as rcnt
 import rpy2.robjects as ro
 import rpy2.robjects.vectors as vc
 from rpy2.rinterface_lib.sexp import NULLType
+from rpy2.rinterface_lib.sexp import Sexp
 
 from .rdataframe import RDataFrame
 from .rdataframe import attempt_pandas_conversion
@@ -14,14 +17,36 @@ from .rlist import convert_r2pydict
 from .rlist import convert_r2pylist
 from .rlist import convert_rlist2py
 from .rlist import is_rlist
+from .rutils import get_rclass_fast
 from .rutils import has_unsupported_rclass
 from .rutils import is_na
+from .rutils import is_unsupported_rclass
 from .rview import RView
 from .rview import convert_s4
 
 
+Handler: TypeAlias = Callable[[Any, bool], Any]
+
+# Conversion handlers of R objects, by (python type, sexptype, R class, ignore_s3_s4)
+HANDLER_CACHE_MAXSIZE = 4096
+_handlers: dict[tuple[type, int, tuple[str, ...], bool], Handler] = {}
+
+
 # TODO: Consider changing return type hint to union of possible types
 def convert_r2py(x: Any, ignore_s3_s4: bool = False) -> Any:
+    # Fast path for R objects: the handler only depends on the python type and
+    # the R type and class of x, which are read without calling R
+    if isinstance(x, Sexp) and not is_na(x):
+        rclass = get_rclass_fast(x)
+        if rclass is not None:
+            key = (type(x), int(x.typeof), rclass, ignore_s3_s4)
+            handler = _handlers.get(key)
+            if handler is None:
+                if len(_handlers) >= HANDLER_CACHE_MAXSIZE:
+                    _handlers.clear()
+                handler = _handlers[key] = get_handler(x, rclass, ignore_s3_s4)
+            return handler(x, ignore_s3_s4)
+
     # Need to import these here to avoid circular imports
     from .rarray import filter_numpy
     from .rarray import get_rarray
@@ -64,3 +89,54 @@ def convert_r2py(x: Any, ignore_s3_s4: bool = False) -> Any:
             return convert_rlist2py(x)
         case _:
             return RView(x)
+
+
+def get_handler(x: Any, rclass: tuple[str, ...], ignore_s3_s4: bool) -> Handler:
+    # Same order as the match in convert_r2py, for the cases matching R objects
+    match x:
+        case NULLType():
+            return to_none
+        case vc.DataFrame():
+            return to_rdataframe
+        case vc.FactorVector():
+            return to_rfactor
+        case vc.Vector() | vc.Matrix() | vc.Array() if not is_rlist(x):
+            return to_rarray
+        case ro.methods.RS4():
+            return to_s4
+        case _ if is_unsupported_rclass(rclass) and not ignore_s3_s4:
+            return to_rview
+        case vc.ListSexpVector() | vc.ListVector():
+            return to_rlist
+        case _:
+            return to_rview
+
+
+def to_none(x: Any, ignore_s3_s4: bool) -> None:
+    return None
+
+
+def to_rdataframe(x: Any, ignore_s3_s4: bool) -> RDataFrame:
+    return RDataFrame(x)
+
+
+def to_rfactor(x: Any, ignore_s3_s4: bool) -> RFactor:
+    return RFactor(x)
+
+
+def to_rarray(x: Any, ignore_s3_s4: bool) -> Any:
+    from .rarray import get_rarray
+
+    return get_rarray(x)  # return RArray, or int|str|bool|float if len == 1
+
+
+def to_s4(x: Any, ignore_s3_s4: bool) -> Any:
+    return convert_s4(x, ignore_s4=ignore_s3_s4)
+
+
+def to_rview(x: Any, ignore_s3_s4: bool) -> RView:
+    return RView(x)
+
+
+def to_rlist(x: Any, ignore_s3_s4: bool) -> Any:
+    return convert_rlist2py(x)
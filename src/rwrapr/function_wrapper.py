@@ -1,51 +1,405 @@
+import itertools
 from collections.abc import Callable
+from collections.abc import Iterable
 from typing import Any
+from typing import Literal
 from typing import TypeAlias
 
+import pandas as pd
+import rpy2.rinterface as ri
+import rpy2.robjects as ro
 import rpy2.robjects.help as rhelp
+from rpy2.rinterface_lib import openrlib
+from rpy2.rinterface_lib.sexp import NULLType
 
+from .aio import get_executor
+from .convert_py2r import convert_py2r
 from .convert_py2r import convert_py_args2r
 from .convert_r2py import convert_r2py
+from .lazy_rexpr import Lazily
 from .lazy_rexpr import lazy_wrap
 from .rarray import RArray
+from .rcache import RCallCache
 from .rdataframe import RDataFrame
 from .rfactor import RFactor
+from .rhelpers import rhelpers
 from .rlist import RDict
 from .rlist import RList
+from .rpool import RFuture
+from .rpool import RWorkerPool
 from .rutils import rcall
 from .rview import RView
 from .settings import settings
+from .tracing import CallTrace
+from .tracing import emit
+from .tracing import in_traced_call
+from .tracing import nbytes
+from .tracing import sinks
 
 
 RReturnType: TypeAlias = RView | RArray | RDataFrame | RFactor | RList | RDict | Any
 
 
-def wrap_rfunc(
-    func: Callable[..., Any], name: str | None
-) -> Callable[..., RReturnType]:
-    if not callable(func):
-        raise ValueError(f"The provided `func` argument: {name} is not callable")
-
-    def wrap(*args: Any, **kwargs: Any) -> RReturnType:
-        # make args mutable
-        args = list(args) if args is not None else args  # type: ignore[assignment]
-        convert_py_args2r(args=args, kwargs=kwargs)  # type: ignore[arg-type]
-        lazyfunc = lazy_wrap(args=args, kwargs=kwargs, func=func, func_name=name)  # type: ignore[arg-type]
-        r_object: Any = lazyfunc(*args, **kwargs)
-        if settings.rview_mode:
+class RFunction:
+    """
+    A Python callable wrapping an R function.
+
+    Arguments are converted to R, and the result is converted back to Python
+    (or returned as an `RView`, if `keep_in_r` or `settings.rview_mode` is set).
+
+    Attributes:
+        func (Callable[..., Any]): The R function.
+        name (str | None): The name used to call the function from R code, e.g., in lazy expressions.
+        cache (RCallCache | Literal[False] | None): The cache memoizing calls. If None,
+            `settings.call_cache` is used (if set), if False calls are never memoized.
+        keep_in_r (bool): If True, results are returned as `RView` handles, which can be
+            passed to other R functions without conversion.
+        pool (RWorkerPool | None): The pool of R worker processes used by `submit`.
+        traced (bool): If False, calls are never traced, e.g., for internal helpers.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        name: str | None,
+        cache: RCallCache | Literal[False] | None = None,
+        keep_in_r: bool = False,
+        pool: RWorkerPool | None = None,
+        traced: bool = True,
+    ) -> None:
+        if not callable(func):
+            raise ValueError(f"The provided `func` argument: {name} is not callable")
+        self.func = func
+        self.name = name
+        self.cache = cache
+        self.keep_in_r = keep_in_r
+        self.pool = pool
+        self.traced = traced
+
+        try:
+            self.__doc__ = func.__doc__
+        except rhelp.HelpNotFoundError:
+            pass
+
+    def __call__(self, *args: Any, **kwargs: Any) -> RReturnType:
+        if sinks and self.traced and not in_traced_call.get():
+            return self._traced_call(args, kwargs)
+
+        r_object = self.call_r(*args, **kwargs)
+        return self._convert_result(r_object)
+
+    def keep(self, *args: Any, **kwargs: Any) -> RView:
+        """
+        Calls the R function, keeping the result in R.
+
+        Args:
+            *args (Any): Positional arguments passed to the R function.
+            **kwargs (Any): Keyword arguments passed to the R function.
+
+        Returns:
+            RView: A handle to the result, which can be passed to other R functions
+                without conversion. Use `.to_py()` to convert it to Python.
+        """
+        return RView(self.call_r(*args, **kwargs))
+
+    def call_r(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Calls the R function, converting the arguments but not the result.
+
+        Args:
+            *args (Any): Positional arguments passed to the R function.
+            **kwargs (Any): Keyword arguments passed to the R function.
+
+        Returns:
+            Any: The R object returned by the function.
+        """
+        lazyfunc, rargs, rkwargs = self._prepare(args, kwargs)
+        return self._call_prepared(lazyfunc, rargs, rkwargs)
+
+    def submit(self, *args: Any, **kwargs: Any) -> RFuture:
+        """
+        Submits a call of the R function to the pool of R worker processes.
+
+        Args:
+            *args (Any): Positional arguments passed to the R function.
+            **kwargs (Any): Keyword arguments passed to the R function.
+
+        Returns:
+            RFuture: The future result of the call.
+
+        Raises:
+            ValueError: If the function has no pool of workers, see `Renv(..., workers=n)`.
+        """
+        if self.pool is None:
+            raise ValueError(
+                f"No pool of R workers for {self.name}, use Renv(..., workers=n)"
+            )
+        lazyfunc, rargs, rkwargs = self._prepare(args, kwargs)
+        return self.pool.submit(lazyfunc, rargs, rkwargs, keep_in_r=self.keep_in_r)
+
+    async def acall(self, *args: Any, **kwargs: Any) -> RReturnType:
+        """
+        Calls the R function from asyncio, on the dedicated R thread.
+
+        The conversion of the arguments and the result also runs on the R thread,
+        such that the event loop is not blocked. If the awaiting task is
+        cancelled while the call is queued, the call is cancelled.
+
+        Args:
+            *args (Any): Positional arguments passed to the R function.
+            **kwargs (Any): Keyword arguments passed to the R function.
+
+        Returns:
+            RReturnType: The result, as returned by calling the function.
+        """
+        return await get_executor().run(self, *args, **kwargs)
+
+    def map(
+        self,
+        kwargs_sets: Iterable[dict[str, Any]],
+        chunksize: int | None = None,
+        **common: Any,
+    ) -> list[RReturnType]:
+        """
+        Calls the R function once per set of keyword arguments, looping in R.
+
+        The argument sets are passed to R together, and the function is applied
+        to each of them with `lapply`, such that there is one call to R (per chunk),
+        instead of one per argument set.
+
+        Args:
+            kwargs_sets (Iterable[dict[str, Any]]): The keyword arguments of each call.
+            chunksize (int | None): The maximum number of calls per call to R, limiting
+                the memory used by arguments and results. Defaults to None (no limit).
+            **common (Any): Keyword arguments passed to every call.
+
+        Returns:
+            list[RReturnType]: The results of the calls, in order.
+
+        Raises:
+            ValueError: If `chunksize` is less than 1.
+            TypeError: If an argument is `Lazily`, which is not supported.
+        """
+        calls = (((), kwargs) for kwargs in kwargs_sets)
+        return self._map(calls, chunksize, common)
+
+    def starmap(
+        self,
+        args_sets: Iterable[Iterable[Any]],
+        chunksize: int | None = None,
+        **common: Any,
+    ) -> list[RReturnType]:
+        """
+        Calls the R function once per set of positional arguments, looping in R.
+
+        See `map`, which takes keyword arguments instead.
+
+        Args:
+            args_sets (Iterable[Iterable[Any]]): The positional arguments of each call.
+            chunksize (int | None): The maximum number of calls per call to R. Defaults to None (no limit).
+            **common (Any): Keyword arguments passed to every call.
+
+        Returns:
+            list[RReturnType]: The results of the calls, in order.
+
+        Raises:
+            ValueError: If `chunksize` is less than 1.
+            TypeError: If an argument is `Lazily`, which is not supported.
+        """
+        calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = [
+            (tuple(args), {}) for args in args_sets
+        ]
+        return self._map(calls, chunksize, common)
+
+    def groupby_apply(
+        self,
+        df: pd.DataFrame,
+        by: str | list[str],
+        data_arg: str | None = None,
+        parallel: bool = False,
+        **kwargs: Any,
+    ) -> RReturnType | dict[Any, RReturnType]:
+        """
+        Calls the R function once per group of rows of a data frame.
+
+        The data frame is converted to R once, and split into groups in R (with
+        `split()`). Groups with missing keys are dropped. If all results are data
+        frames, they are combined into one data frame, with the key columns (which
+        are not already in the results) prepended.
+
+        Args:
+            df (pd.DataFrame): The data frame.
+            by (str | list[str]): The columns defining the groups.
+            data_arg (str | None): The name of the argument taking the group's rows.
+                Defaults to None, passing the rows as the first positional argument.
+            parallel (bool): If True, the groups are run on the pool of R worker
+                processes, see `Renv(..., workers=n)`. Defaults to False.
+            **kwargs (Any): Keyword arguments passed to every call.
+
+        Returns:
+            RReturnType | dict[Any, RReturnType]: The combined data frame, or else
+                the results by group key (a tuple, if grouping by several columns).
+
+        Raises:
+            ValueError: If `parallel` is True, but there is no pool of R workers.
+            TypeError: If an argument is `Lazily`, which is not supported.
+        """
+        if parallel and self.pool is None:
+            raise ValueError(
+                f"No pool of R workers for {self.name}, use Renv(..., workers=n)"
+            )
+        by = [by] if isinstance(by, str) else list(by)
+        if data_arg is not None:
+            data_arg = getattr(self.func, "_prm_translate", {}).get(data_arg, data_arg)
+
+        keys, calls = rhelpers.get("split_groups")(
+            convert_py2r(df),
+            ri.StrSexpVector(by),
+            ro.NULL if data_arg is None else data_arg,
+            self._rlist((), kwargs),
+        )
+        if parallel and self.pool is not None:
+            do_call = rhelpers.get("do.call")
+            futures = [
+                self.pool.submit(do_call, [self.func, calls[i]], {}, keep_in_r=True)
+                for i in range(len(calls))
+            ]
+            results = ro.ListVector(
+                ri.ListSexpVector([future.result().robj for future in futures])
+            )
+        else:
+            results = rhelpers.get("map_call")(self.func, calls, ri.ListSexpVector([]))
+
+        combined = rhelpers.get("combine_groups")(keys, results)
+        if not isinstance(combined, NULLType):
+            return self._convert_result(combined)
+
+        key_frame = convert_r2py(keys)
+        return {
+            key if len(by) > 1 else key[0]: self._convert_result(results[i])
+            for i, key in enumerate(key_frame.itertuples(index=False, name=None))
+        }
+
+    def _map(
+        self,
+        calls: Iterable[tuple[tuple[Any, ...], dict[str, Any]]],
+        chunksize: int | None,
+        common: dict[str, Any],
+    ) -> list[RReturnType]:
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+
+        map_call = rhelpers.get("map_call")
+        rcommon = self._rlist((), common)
+        results: list[RReturnType] = []
+        calls = iter(calls)
+        while chunk := list(itertools.islice(calls, chunksize)):
+            rcalls = ri.ListSexpVector(
+                [self._rlist(args, kwargs) for args, kwargs in chunk]
+            )
+            r_object = map_call(self.func, rcalls, rcommon)
+            if self.keep_in_r or settings.rview_mode:
+                results.extend(RView(r_object[i]) for i in range(len(r_object)))
+            else:
+                results.extend(convert_r2py(r_object))
+        return results
+
+    def _rlist(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        # converts the arguments of one call to an R list, named by the R
+        # names of the keyword arguments
+        for x in (*args, *kwargs.values()):
+            if isinstance(x, Lazily):
+                raise TypeError("Lazy arguments are not supported by map and starmap")
+
+        rargs, rkwargs = list(args), dict(kwargs)
+        convert_py_args2r(args=rargs, kwargs=rkwargs)
+        py2rpy = ro.conversion.get_conversion().py2rpy
+        rlist = ri.ListSexpVector([py2rpy(x) for x in (*rargs, *rkwargs.values())])
+        if rkwargs:
+            translate = getattr(self.func, "_prm_translate", {})
+            names = [""] * len(rargs) + [translate.get(k, k) for k in rkwargs]
+            set_rnames(rlist, names)
+        return rlist
+
+    def _prepare(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[Callable[..., Any], list[Any], dict[str, Any]]:
+        # converts the arguments, and binds lazy arguments to the function
+        rargs = list(args)
+        convert_py_args2r(args=rargs, kwargs=kwargs)
+        lazyfunc = lazy_wrap(
+            args=rargs, kwargs=kwargs, func=self.func, func_name=self.name
+        )
+        return lazyfunc, rargs, kwargs
+
+    def _call_prepared(
+        self, lazyfunc: Callable[..., Any], rargs: list[Any], rkwargs: dict[str, Any]
+    ) -> Any:
+        call_cache = settings.call_cache if self.cache is None else self.cache
+        if call_cache is not None and call_cache is not False:
+            return call_cache.call(lazyfunc, rargs, rkwargs)
+        return lazyfunc(*rargs, **rkwargs)
+
+    def _convert_result(self, r_object: Any) -> RReturnType:
+        if self.keep_in_r or settings.rview_mode:
             return RView(r_object)
         else:
             return convert_r2py(r_object)
 
-    try:
-        wrap.__doc__ = func.__doc__
-    except rhelp.HelpNotFoundError:
-        pass
-    return wrap
+    def _traced_call(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> RReturnType:
+        # as __call__, timing each phase of the call, see tracing.py
+        call_trace = CallTrace(self.name)
+        call_trace.bytes_in = sum(map(nbytes, args)) + sum(map(nbytes, kwargs.values()))
+        token = in_traced_call.set(True)
+        try:
+            with call_trace.phase("convert_in"):
+                rargs = list(args)
+                convert_py_args2r(args=rargs, kwargs=kwargs)
+            with call_trace.phase("lazy_wrap"):
+                lazyfunc = lazy_wrap(
+                    args=rargs, kwargs=kwargs, func=self.func, func_name=self.name
+                )
+            with call_trace.phase("r_call"):
+                r_object = self._call_prepared(lazyfunc, rargs, kwargs)
+            with call_trace.phase("convert_out"):
+                result = self._convert_result(r_object)
+            call_trace.bytes_out = nbytes(result)
+            return result
+        except BaseException as e:
+            call_trace.error = type(e).__name__
+            raise
+        finally:
+            in_traced_call.reset(token)
+            emit(call_trace)
+
+
+def set_rnames(x: Any, names: list[str]) -> None:
+    # Sets the names attribute through R's C-API, without calling R
+    rnames = ri.StrSexpVector(names)
+    openrlib.rlib.Rf_setAttrib(
+        x.__sexp__._cdata, openrlib.rlib.R_NamesSymbol, rnames.__sexp__._cdata
+    )
+
+
+def wrap_rfunc(
+    func: Callable[..., Any],
+    name: str | None,
+    cache: RCallCache | Literal[False] | None = None,
+    keep_in_r: bool = False,
+    pool: RWorkerPool | None = None,
+    traced: bool = True,
+) -> RFunction:
+    return RFunction(
+        func, name=name, cache=cache, keep_in_r=keep_in_r, pool=pool, traced=traced
+    )
 
 
-def rfunc(name: str) -> Callable[..., RReturnType]:
+def rfunc(
+    name: str, keep_in_r: bool = False, pool: RWorkerPool | None = None
+) -> RFunction:
     # Function for getting r-function from global environment
     # BEWARE: THIS FUNCTION WILL TRY TO CONVERT ARGS GOING BOTH IN AND OUT!
     # This function must not be used in Rpy-in functions
-    return wrap_rfunc(rcall(name), name=name)
+    return wrap_rfunc(rcall(name), name=name, keep_in_r=keep_in_r, pool=pool)
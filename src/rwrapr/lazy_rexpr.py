@@ -4,7 +4,7 @@
 from collections.abc import Callable
 from typing import Any
 
-from .rutils import rcall
+from .rsource import rsources
 
 
 class Lazily:
@@ -42,4 +42,9 @@ def lazy_wrap(
     # "," with ','. Python wants to parse the string as
     # "f"function(...) {func_name}(..., {" ?
     # return rcall(f"function(...) {func_name}(..., {",".join(lazy_arg_exprs)})")
-    return rcall(f"function(...) {func_name}(..., {','.join(lazy_arg_exprs)})")
+    # The closure is parsed once, and reused for the same function and lazy
+    # expressions. The order of the expressions is kept, as it matters in R
+    # (e.g., in dplyr::mutate, later expressions may refer to earlier ones)
+    return rsources.function(
+        f"function(...) {func_name}(..., {','.join(lazy_arg_exprs)})"
+    )
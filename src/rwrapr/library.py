@@ -4,7 +4,12 @@ from .renv import Renv
 
 
 def library(
-    env_name: str, interactive: bool = True, lib_loc: str | None = None
+    env_name: str,
+    interactive: bool = True,
+    lib_loc: str | None = None,
+    lazy: bool = False,
+    keep_in_r: bool = False,
+    workers: int | None = None,
 ) -> Renv:
     """
     Load an R environment (package) into the current Python session.
@@ -19,6 +24,12 @@ def library(
             to install missing R packages. Defaults to `True`.
         lib_loc (str | None): The location of the R package. Defaults to None
             (Can be supplied if you are not using the default directory, e.g., if you are using renv).
+        lazy (bool): If `True`, the package is only loaded with `loadNamespace`,
+            and its functions are looked up on first access. Defaults to `False`.
+        keep_in_r (bool): If `True`, the functions return `RView` handles to their
+            results, which are only converted to Python by `.to_py()`. Defaults to `False`.
+        workers (int | None): If supplied, starts a pool of R worker processes, to which
+            calls can be submitted with `.submit()`. Defaults to `None`.
 
     Returns:
         Renv: The loaded R environment.
@@ -28,7 +39,14 @@ def library(
             `interactive` is set to `True`.
     """
     try:
-        return Renv(env_name, interactive=interactive, lib_loc=lib_loc)
+        return Renv(
+            env_name,
+            interactive=interactive,
+            lib_loc=lib_loc,
+            lazy=lazy,
+            keep_in_r=keep_in_r,
+            workers=workers,
+        )
     except rpkg.PackageNotInstalledError:
         if interactive:
             raise
@@ -36,7 +54,12 @@ def library(
 
 
 def importr(
-    env_name: str, interactive: bool = True, lib_loc: str | None = None
+    env_name: str,
+    interactive: bool = True,
+    lib_loc: str | None = None,
+    lazy: bool = False,
+    keep_in_r: bool = False,
+    workers: int | None = None,
 ) -> Renv:
     """
     Load an R environment (package) into the current Python session.
@@ -50,8 +73,21 @@ def importr(
             to install missing R packages. Defaults to `True`.
         lib_loc (str | None): The location of the R package. Defaults to None
             (Can be supplied if you are not using the default directory, e.g., if you are using renv).
+        lazy (bool): If `True`, the package is only loaded with `loadNamespace`,
+            and its functions are looked up on first access. Defaults to `False`.
+        keep_in_r (bool): If `True`, the functions return `RView` handles to their
+            results, which are only converted to Python by `.to_py()`. Defaults to `False`.
+        workers (int | None): If supplied, starts a pool of R worker processes, to which
+            calls can be submitted with `.submit()`. Defaults to `None`.
 
     Returns:
         Renv: The loaded R environment.
     """
-    return library(env_name, interactive=interactive, lib_loc=lib_loc)
+    return library(
+        env_name,
+        interactive=interactive,
+        lib_loc=lib_loc,
+        lazy=lazy,
+        keep_in_r=keep_in_r,
+        workers=workers,
+    )
@@ -1,8 +1,12 @@
 import warnings
+from collections.abc import Callable
+from typing import Any
 
 import rpy2.robjects as ro
 import rpy2.robjects.packages as rpkg
+from rpy2.rinterface_lib.sexp import NULLType
 
+from .rhelpers import rhelpers
 from .utils import pinfo
 
 
@@ -30,12 +34,39 @@ def try_load_namespace(
         if not interactive:
             raise
 
-        choice = input(namespace + " not installed, do you want to install it? (y/n)\n")
-        if choice[0] != "y":
-            raise rpkg.PackageNotInstalledError from rpkg.PackageNotInstalledError
-        pinfo("Installing package...", verbose=verbose)
-        ro.r(f'install.packages("{namespace}")', print_r_warnings=False, invisible=True)
-        pinfo("Package installed!", verbose=verbose)
+        prompt_install(namespace, verbose=verbose)
         module = rpkg.importr(namespace)
 
     return module
+
+
+def prompt_install(namespace: str, verbose: bool = False) -> None:
+    choice = input(namespace + " not installed, do you want to install it? (y/n)\n")
+    if choice[0] != "y":
+        raise rpkg.PackageNotInstalledError from rpkg.PackageNotInstalledError
+    pinfo("Installing package...", verbose=verbose)
+    ro.r(f'install.packages("{namespace}")', print_r_warnings=False, invisible=True)
+    pinfo("Package installed!", verbose=verbose)
+
+
+def try_load_namespace_lazy(
+    namespace: str,
+    lib_loc: str | None = None,
+    verbose: bool = False,
+    interactive: bool = True,
+) -> tuple[dict[str, str], dict[str, str]]:
+    # Loads the namespace with loadNamespace only, without translating its
+    # functions. Returns the exported functions and the datasets of the package,
+    # as maps from python names to R names
+    namespace_assets: Callable[..., Any] = rhelpers.get("namespace_assets")
+    lib = ro.NULL if lib_loc is None else lib_loc
+
+    assets: Any = namespace_assets(namespace, lib)
+    if isinstance(assets, NULLType):
+        if not interactive:
+            raise rpkg.PackageNotInstalledError(namespace)
+        prompt_install(namespace, verbose=verbose)
+        assets = namespace_assets(namespace, lib)
+
+    funcs, datasets = ({x.replace(".", "_"): x for x in names} for names in assets)
+    return funcs, datasets
@@ -0,0 +1,110 @@
+# On-disk cache of the functions and datasets exported by R packages, such that
+# Renv can skip scanning the package (and translating the signatures of all its
+# functions) when a package is loaded again with the same version and path.
+import hashlib
+import json
+import os
+import pathlib
+from typing import Any
+
+import rpy2
+import rpy2.robjects as ro
+from rpy2.rinterface_lib.embedded import RRuntimeError
+from rpy2.rinterface_lib.sexp import NULLType
+
+from .rhelpers import rhelpers
+
+
+# Bump if the manifest format, or the classification of functions and datasets, changes
+MANIFEST_FORMAT = 1
+
+
+def manifest_cache_dir() -> pathlib.Path:
+    cache_dir = os.environ.get("RWRAPR_CACHE_DIR")
+    if cache_dir:
+        return pathlib.Path(cache_dir) / "manifests"
+    return pathlib.Path.home() / ".cache" / "rwrapr" / "manifests"
+
+
+def package_info(env_name: str, lib_loc: str | None) -> tuple[str, str] | None:
+    # returns the version and installation path of the package, or None if
+    # it is not installed
+    info: Any = rhelpers.get("package_info")(
+        env_name, ro.NULL if lib_loc is None else lib_loc
+    )
+    if isinstance(info, NULLType):
+        return None
+    version, path = (str(x) for x in info)
+    return version, path
+
+
+def manifest_path(env_name: str, version: str, path: str) -> pathlib.Path:
+    key = json.dumps([MANIFEST_FORMAT, rpy2.__version__, env_name, version, path])
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return manifest_cache_dir() / f"{env_name}-{version}-{digest}.json"
+
+
+def load_manifest(
+    env_name: str, lib_loc: str | None
+) -> tuple[set[str], set[str]] | None:
+    """
+    Loads the cached functions and datasets of an installed R package.
+
+    Args:
+        env_name (str): The name of the R package.
+        lib_loc (str | None): The location of the R package.
+
+    Returns:
+        tuple[set[str], set[str]] | None: The functions and datasets of the package,
+            or None if the package is not installed or not cached.
+    """
+    try:
+        info = package_info(env_name, lib_loc)
+        if info is None:
+            return None
+
+        with open(manifest_path(env_name, *info)) as f:
+            manifest = json.load(f)
+        return set(manifest["functions"]), set(manifest["datasets"])
+    except (RRuntimeError, OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_manifest(
+    env_name: str, lib_loc: str | None, funcs: set[str], datasets: set[str]
+) -> None:
+    """
+    Saves the functions and datasets of an installed R package.
+
+    Fails silently, e.g., if the cache directory is not writable, or the
+    package's DESCRIPTION can not be read.
+
+    Args:
+        env_name (str): The name of the R package.
+        lib_loc (str | None): The location of the R package.
+        funcs (set[str]): The functions of the package.
+        datasets (set[str]): The datasets of the package.
+    """
+    try:
+        info = package_info(env_name, lib_loc)
+        if info is None:
+            return
+
+        path = manifest_path(env_name, *info)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "format": MANIFEST_FORMAT,
+            "package": env_name,
+            "version": info[0],
+            "path": info[1],
+            "functions": sorted(funcs),
+            "datasets": sorted(datasets),
+        }
+        # write to a temporary file first, such that concurrent workers never
+        # read a partially written manifest
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, path)
+    except (RRuntimeError, OSError):
+        pass
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import warnings
-from collections.abc import Callable
+from collections.abc import Mapping
 from typing import Any
 from typing import TypeAlias
 
 import numpy as np
+import rpy2.rinterface as ri
 import rpy2.robjects as ro
 import rpy2.robjects.vectors as vc
 from numpy.typing import NDArray
+from rpy2.rinterface_lib import openrlib
 from rpy2.rinterface_lib.sexp import NULLType
 
 from .convert_py2r import convert_py2r
 from .rattributes import get_rattributes
+from .settings import settings
 from .toggle_rview import ToggleRView
 
 
@@ -21,15 +24,18 @@ NPArrayIndex: TypeAlias = tuple[slice | int | list[Any] | NDArray[Any], ...]
 
 class RArray(np.ndarray[Any, Any]):
     def __new__(cls, rdata: Any) -> RArray:
-        arr = convert_numpy(rdata)
+        arr = convert_numpy(rdata, zero_copy=settings.zero_copy)
         if not isinstance(arr, np.ndarray):
             raise TypeError("convert_numpy(Rdata) must return a numpy.ndarray")
 
-        # Ensure the array is in C order
-        arr_c = np.ascontiguousarray(arr)
-        obj = arr_c.view(cls)
+        if is_rmemory_view(arr):
+            # Keep R's column-major layout, rather than copying to C order
+            obj = arr.view(cls)
+        else:
+            # Ensure the array is in C order
+            obj = np.ascontiguousarray(arr).view(cls)
 
-        obj._rattributes = get_attributes_array(rdata)
+        obj._rattributes = prepare_names(get_attributes_array(rdata))
         return obj
 
     def __array_finalize__(self, obj: Any) -> None:
@@ -45,9 +51,9 @@ class RArray(np.ndarray[Any, Any]):
         if not isinstance(result, RArray):
             return result
 
-        # Copy the _rattributes
+        # Shallow copy of the _rattributes, the names are replaced below
         if hasattr(self, "_rattributes") and self._rattributes is not None:
-            result._rattributes = getattr(self, "_rattributes", {}).copy()
+            result._rattributes = dict(self._rattributes)
 
             orig_dimnames = self._rattributes.get("dimnames", None)
             orig_names = self._rattributes.get("names", None)
@@ -62,47 +68,37 @@ class RArray(np.ndarray[Any, Any]):
             # Determine which dimensions are kept after indexing
             dims_kept = self._get_dims_kept(index_normalized)
 
-            # Update dimnames for multi-dimensional arrays
+            # Update dimnames for multi-dimensional arrays. The names are
+            # read-only arrays shared with self, so slices of them are views
             if orig_dimnames is not None:
-                new_dimnames: list[NDArray[np.str_] | None] = []
+                if isinstance(orig_dimnames, Mapping):
+                    dimnames_items = list(orig_dimnames.items())
+                else:
+                    dimnames_items = list(enumerate(orig_dimnames))
+
+                new_dimnames_items: list[tuple[Any, NDArray[np.str_] | None]] = []
                 for i, keep_dim in enumerate(dims_kept):
-                    if i >= len(orig_dimnames):
+                    if i >= len(dimnames_items):
                         continue  # No dimname for this dimension
 
-                    names = orig_dimnames[i]
-                    idx = index_normalized[i]
-
-                    if keep_dim:
-                        if names is None:
-                            new_dimnames.append(None)
-                        else:
-                            names_array = np.array(names)
-                            try:
-                                new_names = names_array[idx]
-                            except Exception:
-                                indices = np.arange(len(names_array))[idx]
-                                new_names = names_array[indices]
+                    if keep_dim:  # else the dimension is removed
+                        key, names = dimnames_items[i]
+                        new_names = subset_names(names, index_normalized[i])
+                        new_dimnames_items.append((key, new_names))
 
-                            new_dimnames.append(new_names)
-                    else:
-                        # Dimension is removed, do not add dimname
-                        pass
-
-                result._rattributes["dimnames"] = new_dimnames
+                if isinstance(orig_dimnames, Mapping):
+                    result._rattributes["dimnames"] = dict(new_dimnames_items)
+                else:
+                    result._rattributes["dimnames"] = [
+                        names for _, names in new_dimnames_items
+                    ]
 
             # Update names for 1D arrays
             elif orig_names is not None:
                 if ndim_self == 1 and ndim_result >= 1:
-                    names = orig_names
-                    idx = index_normalized[0]
-                    names_array = np.array(names)
-                    try:
-                        new_names = names_array[idx]
-                    except Exception:
-                        indices = np.arange(len(names_array))[idx]
-                        new_names = names_array[indices]
-
-                    result._rattributes["names"] = new_names
+                    result._rattributes["names"] = subset_names(
+                        orig_names, index_normalized[0]
+                    )
                 elif ndim_self == 1 and ndim_result == 0:
                     result._rattributes.pop("names", None)
 
@@ -162,7 +158,6 @@ class RArray(np.ndarray[Any, Any]):
             r_attributes = attributes2r(self._rattributes)
             if r_attributes:
                 r_object = structure(r_object, **r_attributes)
-            r_object = structure(r_object, **r_attributes)
 
         return r_object
 
@@ -181,12 +176,87 @@ def get_attributes_array(x: Any) -> dict[str, Any] | None | Any:
     return get_rattributes(x, exclude=["class"])
 
 
+def freeze_names(names: Any) -> NDArray[np.str_] | None:
+    # Builds the names of a dimension once, as a read-only array. Subsets of
+    # it are then views, or new arrays, but it is never modified in place
+    if names is None:
+        return None
+    out = np.atleast_1d(np.array(names, dtype="U"))
+    out.flags.writeable = False
+    return out
+
+
+def prepare_names(attributes: Any) -> dict[str, Any] | None:
+    # Converts the names and dimnames attributes to read-only arrays, such that
+    # RArray.__getitem__ can index them directly
+    if attributes is None:
+        return None
+
+    out = dict(attributes)
+    if out.get("names") is not None:
+        out["names"] = freeze_names(out["names"])
+
+    dimnames = out.get("dimnames")
+    if isinstance(dimnames, Mapping):
+        out["dimnames"] = {k: freeze_names(v) for k, v in dimnames.items()}
+    elif dimnames is not None:
+        out["dimnames"] = [freeze_names(names) for names in dimnames]
+    return out
+
+
+def subset_names(names: Any, idx: Any) -> NDArray[np.str_] | None:
+    if names is None:
+        return None
+    if not isinstance(names, np.ndarray):
+        names = freeze_names(names)  # e.g., set by the user
+    try:
+        return names[idx]  # type: ignore
+    except (IndexError, TypeError, ValueError):
+        return names[np.arange(len(names))[idx]]  # type: ignore
+
+
+class RMemoryOwner:
+    """
+    Exposes the memory of a numeric R vector to numpy, without copying it.
+
+    Arrays created from an `RMemoryOwner` (and all views of them) hold a
+    reference to it, which in turn keeps the R object protected from R's
+    garbage collector for as long as the arrays are alive.
+    """
+
+    def __init__(self, rdata: vc.Vector) -> None:
+        self.rdata = rdata
+        # the array interface of the R vector points into memory owned by R,
+        # but does not keep the R object alive. Pointing numpy at the same
+        # memory through this object does.
+        interface = np.asarray(rdata).__array_interface__
+        ptr, _ = interface["data"]
+        self.__array_interface__ = interface | {"data": (ptr, True)}  # read-only
+
+
+def is_rmemory_view(x: NDArray[Any]) -> bool:
+    return isinstance(x.base, RMemoryOwner)
+
+
 def convert_numpy(
-    x: vc.Vector | NDArray[Any] | NULLType | Any, flatten: bool = False
+    x: vc.Vector | NDArray[Any] | NULLType | Any,
+    flatten: bool = False,
+    zero_copy: bool = False,
 ) -> NDArray[Any] | int | str | float | bool | None:
     if isinstance(x, NULLType):
         return None
 
+    if zero_copy and isinstance(
+        x,
+        vc.FloatVector
+        | vc.FloatArray
+        | vc.FloatMatrix
+        | vc.IntVector
+        | vc.IntArray
+        | vc.IntMatrix,
+    ):
+        return filter_numpy(np.asarray(RMemoryOwner(x)), flatten=flatten)
+
     dtype: str | None = None
     match x:  # this should be expanded upon
         case vc.BoolVector() | vc.BoolArray() | vc.BoolMatrix():
@@ -200,7 +270,9 @@ def convert_numpy(
         case _:
             dtype = None  # not really necessary, but for clarity
 
-    y = np.asarray(x, dtype=dtype)
+    # Always copy, numeric R vectors would otherwise be viewed without keeping
+    # the R object alive
+    y = np.array(x, dtype=dtype, order="C")
     return filter_numpy(y, flatten=flatten)
 
 
@@ -223,7 +295,8 @@ def is_valid_numpy(x: NDArray[Any]) -> bool:
 
 
 def convert_numpy2r(x: NDArray[Any]) -> Any:  # RBaseObject:
-    y = x.copy()
+    # No defensive copy, the data is copied exactly once, into the R vector
+    y = np.asarray(x)
     if not y.shape:
         y = y[np.newaxis]
     match len(y.shape):
@@ -237,14 +310,39 @@ def convert_numpy2r(x: NDArray[Any]) -> Any:  # RBaseObject:
             return convert_numpyND(y)
 
 
+# R integers are 32 bit, and the smallest value is reserved for NA
+RINT_MAX: int = np.iinfo(np.int32).max
+
+
+def fits_rinteger(x: NDArray[np.integer[Any]]) -> bool:
+    if x.dtype.itemsize <= 4 or x.size == 0:
+        return True
+    return bool(x.min() >= -RINT_MAX and x.max() <= RINT_MAX)
+
+
+def rvector_dtype(x: NDArray[Any]) -> type[np.generic] | None:
+    # dtypes with the same memory layout as R's integer and double vectors,
+    # which rpy2 copies into a new R vector with a single memmove
+    match x.dtype.kind:
+        case "i" if fits_rinteger(x):
+            return np.int32
+        case "f":
+            return np.float64
+        case _:
+            return None  # keep the dtype
+
+
 def convert_numpy1D(x: NDArray[Any]) -> Any:  # RBaseObject:
     match x.dtype.kind:
         case "b":
-            return ro.BoolVector(x)
+            # R stores logicals as 32 bit integers
+            return ro.BoolVector(np.ascontiguousarray(x, dtype=np.int32))
         case "i":
-            return ro.IntVector(x)
+            # falls back to element-wise conversion (and an OverflowError) for
+            # integers which do not fit in an R integer
+            return ro.IntVector(np.ascontiguousarray(x, dtype=rvector_dtype(x)))
         case "f":
-            return ro.FloatVector(x)
+            return ro.FloatVector(np.ascontiguousarray(x, dtype=np.float64))
         case "U" | "S":
             return ro.StrVector(x)
         case "O":
@@ -262,16 +360,41 @@ def convert_numpy1D(x: NDArray[Any]) -> Any:  # RBaseObject:
 
 
 def convert_numpy2D(x: NDArray[Any]) -> Any:  # RBaseObject:
-    flat_x: NDArray[Any] = x.flatten(order="F")
-    nrow, ncol = x.shape
-    y = convert_numpy1D(flat_x)
-    f: Callable[..., Any] | Any = ro.r("matrix")
-    return f(y, nrow=nrow, ncol=ncol)
+    return convert_numpyND(x)
 
 
 def convert_numpyND(x: NDArray[Any]) -> Any:  # RBaseObject:
-    flat_x: NDArray[Any] = x.flatten(order="F")
-    dim: tuple[int, ...] = x.shape
+    # Copy into a Fortran-ordered buffer of the dtype R expects, in one pass
+    # (no copy at all if x already is one). The flat view of it is then copied
+    # into the R vector, and R's dim attribute set in place.
+    flat_x: NDArray[Any] = np.asfortranarray(x, dtype=rvector_dtype(x)).ravel(
+        order="F"
+    )
     y = convert_numpy1D(flat_x)
-    f: Callable[..., Any] | Any = ro.r("array")
-    return f(y, dim=ro.IntVector(dim))
+    if type(y) in RARRAY_CLASSES:
+        return set_rdim(y, x.shape)
+
+    # other results (e.g., lists, or arrays of unsupported dtypes) are shaped
+    # with R's array(), as the dim can not be set on them in place
+    from .rhelpers import rhelpers
+
+    return rhelpers.get("array")(y, dim=ro.IntVector(x.shape))
+
+
+RARRAY_CLASSES: dict[type[Any], tuple[type[Any], type[Any]]] = {
+    ro.BoolVector: (vc.BoolMatrix, vc.BoolArray),
+    ro.IntVector: (vc.IntMatrix, vc.IntArray),
+    ro.FloatVector: (vc.FloatMatrix, vc.FloatArray),
+    ro.StrVector: (vc.StrMatrix, vc.StrArray),
+}
+
+
+def set_rdim(x: Any, dim: tuple[int, ...]) -> Any:
+    # Sets the dim attribute through R's C-API, instead of calling matrix()
+    # or array() in R, which would also copy the vector
+    rdim = ri.IntSexpVector(np.asarray(dim, dtype=np.int32))
+    openrlib.rlib.Rf_setAttrib(
+        x.__sexp__._cdata, openrlib.rlib.R_DimSymbol, rdim.__sexp__._cdata
+    )
+    matrix_cls, array_cls = RARRAY_CLASSES[type(x)]
+    return matrix_cls(x) if len(dim) == 2 else array_cls(x)
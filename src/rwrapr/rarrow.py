@@ -0,0 +1,117 @@
+# Transfer of data frames between pandas and R through the Arrow C stream
+# interface. Requires pyarrow and the R arrow package. The frames are exported
+# as a stream of record batches, such that numeric columns are shared rather
+# than copied element by element, and strings and factors are moved in bulk.
+# The results match those of the pandas2ri converter, including the row names
+# and index. All functions return None if the transfer is not possible, such
+# that callers can fall back to the pandas2ri converter.
+import ctypes
+from typing import Any
+
+import pandas as pd
+import rpy2.robjects.vectors as vc
+
+from .rhelpers import r_session_id
+from .rhelpers import rhelpers
+
+
+try:
+    import pyarrow as pa  # type: ignore
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+class ArrowArrayStream(ctypes.Structure):
+    # struct ArrowArrayStream from the Arrow C stream interface
+    _fields_ = [
+        ("get_schema", ctypes.c_void_p),
+        ("get_next", ctypes.c_void_p),
+        ("get_last_error", ctypes.c_void_p),
+        ("release", ctypes.c_void_p),
+        ("private_data", ctypes.c_void_p),
+    ]
+
+
+_r_arrow_available: dict[int, bool] = {}
+
+
+def arrow_available() -> bool:
+    # checked once per R session
+    if pa is None:
+        return False
+
+    session = r_session_id()
+    if session not in _r_arrow_available:
+        try:
+            available: Any = rhelpers.get("arrow_available")()
+            _r_arrow_available[session] = bool(available[0])
+        except Exception:
+            _r_arrow_available[session] = False
+    return _r_arrow_available[session]
+
+
+def has_default_index(df: pd.DataFrame) -> bool:
+    # Other indices are kept as row names by the pandas2ri converter
+    index = df.index
+    return (
+        isinstance(index, pd.RangeIndex)
+        and index.start == 0
+        and index.step == 1
+        and index.name is None
+    )
+
+
+def has_arrow_dtypes(df: pd.DataFrame) -> bool:
+    # Columns which pandas2ri converts to the same R types and values. Other
+    # columns (e.g., datetimes, nullable integers, strings with NA) keep pandas2ri
+    for column in df.columns:
+        dtype = df[column].dtype
+        if isinstance(dtype, pd.CategoricalDtype) or dtype.kind in "bif":
+            continue
+        if (
+            dtype.kind == "O"
+            and not df[column].hasnans
+            and pd.api.types.infer_dtype(df[column]) == "string"
+        ):
+            continue
+        return False
+    return True
+
+
+def arrow_pandas2r(df: pd.DataFrame) -> vc.DataFrame | None:
+    if not has_default_index(df) or not arrow_available():
+        return None
+    if not df.columns.is_unique or not has_arrow_dtypes(df):
+        return None
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        reader = pa.RecordBatchReader.from_batches(table.schema, table.to_batches())
+        stream = ArrowArrayStream()
+        address = ctypes.addressof(stream)
+        reader._export_to_c(address)
+        # R takes ownership of the stream, and releases it when read
+        rdf: vc.DataFrame = rhelpers.get("arrow_import")(float(address))
+        return rdf
+    except Exception:
+        return None
+
+
+def arrow_r2pandas(df: vc.DataFrame) -> pd.DataFrame | None:
+    if not arrow_available():
+        return None
+
+    try:
+        stream = ArrowArrayStream()
+        address = ctypes.addressof(stream)
+        exported: Any = rhelpers.get("arrow_export")(df, float(address))
+        if not exported[0]:  # data frames with row names are not exported
+            return None
+
+        reader = pa.RecordBatchReader._import_from_c(address)
+        pdf: pd.DataFrame = reader.read_all().to_pandas()
+        # pandas2ri keeps the automatic row names as the index "1", "2", ...
+        pdf.index = pd.Index([str(i) for i in range(1, len(pdf) + 1)])
+        return pdf
+    except Exception:
+        return None
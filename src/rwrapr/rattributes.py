@@ -1,36 +1,56 @@
 from collections.abc import Callable
 from typing import Any
 
+from rpy2.rinterface_lib.sexp import Sexp
+
 from .convert_py2r import convert_py_args2r
 from .rlist import RDict
 
 
 def get_rattributes(x: Any, exclude: list[str] | None = None) -> Any:
-    from .function_wrapper import rfunc
+    from .rhelpers import rhelpers
 
     if exclude is None:
         exclude = []
 
-    attributes: Callable[..., Any] = rfunc(
-        """
-    function(x, exclude) {
-        attributes <- attributes(x)
-        if (is.null(attributes)) return(NULL)
-
-        attributes <- attributes[!names(attributes) %in% exclude]
-        if (length(attributes) == 0) return(NULL)
+    # Skip the call to R if x has no other attributes than the excluded ones,
+    # the names of the attributes are read through the C-API
+    attribute_names = list_rattributes(x)
+    if attribute_names is not None and attribute_names <= set(exclude):
+        return None
 
-        attributes
-    }
-    """
-    )
+    attributes: Callable[..., Any] = rhelpers.wrapped("attributes")
     return attributes(x, exclude)
 
 
+def list_rattributes(x: Any) -> set[str] | None:
+    # Returns None if x is not an R object
+    if not isinstance(x, Sexp):
+        return None
+    try:
+        return set(x.list_attrs())
+    except Exception:
+        return None
+
+
+def get_rattributes_direct(x: Any, exclude: list[str] | None = None) -> Any:
+    # As get_rattributes, but reads each attribute through the C-API, without
+    # calling R. Falls back to get_rattributes if x is not an R object
+    from .convert_r2py import convert_r2py
+
+    if not isinstance(x, Sexp):
+        return get_rattributes(x, exclude)
+
+    names = [name for name in x.list_attrs() if name not in (exclude or [])]
+    if not names:
+        return None
+    return {name: convert_r2py(x.do_slot(name)) for name in names}
+
+
 def structure(x: Any, **kwargs: Any) -> Any:
-    from .rutils import rcall
+    from .rhelpers import rhelpers
 
-    return rcall("structure")(x, **kwargs)
+    return rhelpers.get("structure")(x, **kwargs)
 
 
 def attributes2r(attrs: dict[str, Any] | None | RDict) -> dict[str, Any]:
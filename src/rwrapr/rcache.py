@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import hashlib
+import pathlib
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+
+from .settings import Settings
+from .settings import settings
+
+
+class RCallCache:
+    """
+    A memoization cache for calls to pure R functions.
+
+    Results are stored as R objects, keyed on a hash of the R function and its
+    (already converted) arguments. The in-memory tier is an LRU cache bounded
+    by the number of entries and by their total size in bytes, as reported by
+    R's `object.size()`. Optionally, results are also saved as RDS files in
+    `cache_dir`, which are reused by later Python sessions.
+
+    Only use the cache for functions without side effects, whose results only
+    depend on their arguments.
+
+    Attributes:
+        maxsize (int): The maximum number of results kept in memory.
+        maxbytes (int | None): The maximum total size of the results kept in memory.
+        cache_dir (pathlib.Path | None): The directory of the on-disk tier.
+        hits (int): The number of calls answered from the cache.
+        misses (int): The number of calls evaluated in R.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        maxbytes: int | None = 1024**3,
+        cache_dir: str | pathlib.Path | None = None,
+    ) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of results kept in memory. Defaults to 128.
+            maxbytes (int | None): The maximum total size (in bytes) of the results kept
+                in memory. Defaults to 1 GiB. If None, only `maxsize` applies.
+            cache_dir (str | pathlib.Path | None): If supplied, results are also saved as
+                RDS files in this directory. Defaults to None.
+        """
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.cache_dir = pathlib.Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """The total size (in bytes) of the results kept in memory."""
+        return self._nbytes
+
+    def make_key(
+        self, func: Callable[..., Any], args: list[Any], kwargs: dict[str, Any]
+    ) -> str:
+        """
+        Hashes an R function and its arguments.
+
+        The function and the arguments are serialized together in R, so
+        functions from packages are identified by their body and the name and
+        version of their namespace.
+
+        Args:
+            func (Callable[..., Any]): The R function.
+            args (list[Any]): The positional arguments, converted to R.
+            kwargs (dict[str, Any]): The keyword arguments, converted to R.
+
+        Returns:
+            str: The hex digest of the serialized call.
+        """
+        from .rhelpers import rhelpers
+
+        serialize: Callable[..., Any] = rhelpers.get("serialize_call")
+        raw = serialize(func, *args, **kwargs)
+        return hashlib.sha256(np.asarray(raw).data).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """
+        Gets a cached result.
+
+        Args:
+            key (str): The key of the call, see `make_key`.
+
+        Returns:
+            Any | None: The R object, or None if the call is not cached.
+        """
+        from .rhelpers import rhelpers
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+
+        r_object = rhelpers.get("readRDS")(str(path))
+        self._store(key, r_object)
+        return r_object
+
+    def put(self, key: str, r_object: Any) -> None:
+        """
+        Stores a result in memory, and on disk if `cache_dir` is set.
+
+        Args:
+            key (str): The key of the call, see `make_key`.
+            r_object (Any): The R object returned by the call.
+        """
+        from .rhelpers import rhelpers
+
+        path = self._path(key)
+        if path is not None:
+            rhelpers.get("saveRDS")(r_object, file=str(path))
+        self._store(key, r_object)
+
+    def call(
+        self, func: Callable[..., Any], args: list[Any], kwargs: dict[str, Any]
+    ) -> Any:
+        """
+        Calls an R function, or returns the cached result of an identical call.
+
+        Args:
+            func (Callable[..., Any]): The R function.
+            args (list[Any]): The positional arguments, converted to R.
+            kwargs (dict[str, Any]): The keyword arguments, converted to R.
+
+        Returns:
+            Any: The R object returned by the call.
+        """
+        key = self.make_key(func, args, kwargs)
+        r_object = self.get(key)
+        if r_object is not None:
+            self.hits += 1
+            return r_object
+
+        self.misses += 1
+        r_object = func(*args, **kwargs)
+        self.put(key, r_object)
+        return r_object
+
+    def clear(self) -> None:
+        """Removes all results kept in memory. RDS files in `cache_dir` are kept."""
+        self._entries.clear()
+        self._nbytes = 0
+
+    def _path(self, key: str) -> pathlib.Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}.rds"
+
+    def _store(self, key: str, r_object: Any) -> None:
+        from .rhelpers import rhelpers
+
+        nbytes = int(rhelpers.get("object_size")(r_object)[0])
+        if self.maxbytes is not None and nbytes > self.maxbytes:
+            return
+
+        if key in self._entries:
+            self._nbytes -= self._entries.pop(key)[1]
+        self._entries[key] = (r_object, nbytes)
+        self._nbytes += nbytes
+
+        while len(self._entries) > self.maxsize or (
+            self.maxbytes is not None and self._nbytes > self.maxbytes
+        ):
+            _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+            self._nbytes -= evicted_nbytes
+
+
+class Memoize:
+    """
+    A context manager memoizing all calls to wrapped R functions within a `with` block.
+
+    The cache is only used in the current context (see `Settings.override`).
+
+    Attributes:
+        cache (RCallCache): The cache used within the block.
+    """
+
+    def __init__(self, cache: RCallCache | None = None, **kwargs: Any) -> None:
+        """
+        Initializes the Memoize context manager.
+
+        Args:
+            cache (RCallCache | None): The cache to use. If None, a new cache
+                is created with `kwargs`, e.g., `maxsize` or `cache_dir`.
+            **kwargs (Any): Passed to `RCallCache` if `cache` is None.
+        """
+        self.cache = cache if cache is not None else RCallCache(**kwargs)
+        self.override: AbstractContextManager[Settings] | None = None
+
+    def __enter__(self) -> RCallCache:
+        """
+        Set the cache used by wrapped R functions when entering the context block.
+
+        Returns:
+            RCallCache: The cache used within the block.
+        """
+        self.override = settings.override(call_cache=self.cache)
+        self.override.__enter__()
+        return self.cache
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """
+        Restore the previous cache when exiting the context block, propagating exceptions.
+
+        Args:
+            exc_type (Optional[Type[BaseException]]): The type of the exception if one was raised.
+            exc_val (Optional[BaseException]): The exception instance if one was raised.
+            exc_tb (Optional[TracebackType]): The traceback object if an exception occurred.
+        """
+        if self.override is not None:
+            self.override.__exit__(None, None, None)
+            self.override = None
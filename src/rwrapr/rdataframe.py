@@ -1,4 +1,6 @@
+import copy
 import warnings
+from collections.abc import Iterator
 from typing import Any
 
 import pandas as pd
@@ -6,7 +8,10 @@ import rpy2.robjects as ro
 import rpy2.robjects.vectors as vc
 from rpy2.robjects import pandas2ri
 
+from .rarrow import arrow_pandas2r
+from .rarrow import arrow_r2pandas
 from .rattributes import get_rattributes
+from .settings import settings
 from .toggle_rview import ToggleRView
 
 
@@ -42,18 +47,73 @@ class RDataFrame(pd.DataFrame):
             out = pd.DataFrame(self)
         return out
 
+    @staticmethod
+    def iter_chunks(data_frame: Any, rows: int = 100_000) -> Iterator["RDataFrame"]:
+        """
+        Converts an R data.frame to pandas in chunks of rows.
+
+        Only one chunk is held in Python at a time, e.g., when writing a large
+        R data.frame to a file chunk by chunk. Each chunk keeps the R attributes
+        of the whole data.frame, and the rows are numbered as in the whole data.frame.
+
+        Args:
+            data_frame (Any): The R data.frame, either as an R object or an RView.
+            rows (int): The (maximum) number of rows in each chunk. Defaults to 100 000.
+
+        Yields:
+            RDataFrame: The chunks of the data.frame.
+
+        Raises:
+            ValueError: If `rows` is not positive.
+        """
+        from .rhelpers import rhelpers
+        from .rview import RView
+
+        if rows < 1:
+            raise ValueError(f"rows must be positive, got {rows}")
+
+        rdf: vc.DataFrame = (
+            data_frame.to_r() if isinstance(data_frame, RView) else data_frame
+        )
+        attrs = get_attributes_dataframe(rdf)
+        slice_rows = rhelpers.get("slice_rows")
+        automatic_row_names = rhelpers.get("automatic_row_names")(rdf)[0]
+
+        nrow = rdf.nrow
+        for start in range(0, nrow, rows):
+            stop = min(start + rows, nrow)
+            # converted directly, as the attributes are those of the whole data.frame
+            chunk = RDataFrame(r2pandas(slice_rows(rdf, start + 1, stop)))
+            if automatic_row_names:  # the rows are numbered "1", "2", ... in each slice
+                chunk.index = pd.Index([str(i) for i in range(start + 1, stop + 1)])
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                chunk._rattributes = copy.copy(attrs)
+            yield chunk
+
 
 def get_attributes_dataframe(df: vc.DataFrame) -> dict[str, Any] | None | Any:
     return get_rattributes(df, exclude=["names", "class", "row.names"])
 
 
 def pandas2r(df: pd.DataFrame) -> vc.DataFrame:
+    if settings.arrow_transfer:
+        arrow_rdf = arrow_pandas2r(df)
+        if arrow_rdf is not None:
+            return arrow_rdf
+
     with (ro.default_converter + pandas2ri.converter).context():
         rdf: vc.DataFrame = ro.conversion.get_conversion().py2rpy(df)
     return rdf
 
 
 def r2pandas(df: vc.DataFrame) -> pd.DataFrame:
+    if settings.arrow_transfer:
+        arrow_pdf = arrow_r2pandas(df)
+        if arrow_pdf is not None:
+            return arrow_pdf
+
     with (ro.default_converter + pandas2ri.converter).context():
         pdf: pd.DataFrame = ro.conversion.get_conversion().rpy2py(df)
     return pdf
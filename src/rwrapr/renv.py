@@ -1,5 +1,7 @@
 import pathlib
+import weakref
 from collections.abc import Callable
+from types import TracebackType
 from typing import Any
 
 import pandas as pd
@@ -11,7 +13,16 @@ from .function_wrapper import RReturnType
 from .function_wrapper import rfunc  # wrap_rfunc should perhaps be its own module
 from .function_wrapper import wrap_rfunc  # wrap_rfunc should perhaps be its own module
 from .load_namespace import try_load_namespace
+from .load_namespace import try_load_namespace_lazy
+from .manifest import load_manifest
+from .manifest import save_manifest
+from .rcache import RCallCache
+from .rhelpers import rhelpers
 from .rlist import RDict
+from .rpool import RWorkerPool
+from .rpool import register_library
+from .rsource import rsources
+from .rsource import script_function
 from .rutils import rcall
 from .rview import RView
 from .settings import settings
@@ -25,9 +36,12 @@ class Renv:
     it is searched for in the global R environment.
 
     Attributes:
-        __base_lib (rpkg.Package | None): The loaded R package.
+        __base_lib (rpkg.Package | None): The loaded R package. If the package manifest
+            is cached on disk, the package is loaded on first access of a function or dataset.
         __rfuncs (set[str] | None): The set of R functions available in the environment.
         __rdatasets (set[str] | None): The set of R datasets available in the environment.
+        __rnames (dict[str, str]): The R names of the functions and datasets, if loaded lazily.
+        pool (RWorkerPool | None): The pool of R worker processes, if `workers` is supplied.
         NULL (Any): Equivalent to R's `NULL`.
         NA (Any): Equivalent to R's `NA`.
         NaN (Any): Equivalent to R's `NaN`.
@@ -36,7 +50,13 @@ class Renv:
     """
 
     def __init__(
-        self, env_name: str | None, interactive: bool = True, lib_loc: str | None = None
+        self,
+        env_name: str | None,
+        interactive: bool = True,
+        lib_loc: str | None = None,
+        lazy: bool = False,
+        keep_in_r: bool = False,
+        workers: int | None = None,
     ) -> None:
         """
         Initializes the R environment by loading the specified R package and its associated functions and datasets.
@@ -46,24 +66,70 @@ class Renv:
             interactive (bool): If True, prompts the user to install missing R packages. Defaults to True.
             lib_loc (str | None): The location of the R package. Defaults to None
                 (Can be supplied if you are not using the default directory, e.g., if you are using renv).
+            lazy (bool): If True, the package is only loaded with `loadNamespace` (not attached),
+                and each function is looked up with `getExportedValue` on first access,
+                instead of translating all functions of the package up front. Defaults to False.
+            keep_in_r (bool): If True, the functions of the environment return `RView` handles
+                to their results, which can be passed to other R functions without conversion.
+                Use `.to_py()` to convert a handle to Python. Defaults to False.
+            workers (int | None): If supplied, a pool of R worker processes is started,
+                and calls of the functions of the environment can be run in parallel with
+                `.submit()`. Defaults to None. The pool is shut down by `close()`, at
+                the end of a `with` block, or when the Renv is garbage collected.
         """
+        self.__base_lib: rpkg.Package | None = None
+        self.__env_name = env_name
+        self.__interactive = interactive
+        self.__lib_loc = lib_loc
+        self.__lazy = lazy
+        self.__keep_in_r = keep_in_r
+        self.pool: RWorkerPool | None = None
+        self.__pool_finalizer: weakref.finalize[Any, Any] | None = None
+        self.__rnames: dict[str, str] = {}
         if (env_name is None) or (env_name == ""):
-            self.__base_lib: rpkg.Package | None = None
             self.__rfuncs: set[str] | None = None
             self.__rdatasets: set[str] | None = None
             return
 
         pinfo("Loading packages...", verbose=True)
-        self.__set_base_lib(
-            try_load_namespace(
+        manifest = (
+            load_manifest(env_name, lib_loc=lib_loc)
+            if settings.manifest_cache and not lazy
+            else None
+        )
+        if lazy:
+            rfuncs, rdatasets = try_load_namespace_lazy(
                 env_name, verbose=True, interactive=interactive, lib_loc=lib_loc
             )
-        )
+            self.__rnames = rfuncs | rdatasets
+            funcs, datasets = set(rfuncs), set(rdatasets)
+        elif manifest is not None:
+            # warm start: attach the package, but defer importr until first use
+            funcs, datasets = manifest
+            rhelpers.get("attach_package")(
+                env_name, ro.NULL if lib_loc is None else lib_loc
+            )
+        else:
+            self.__set_base_lib(
+                try_load_namespace(
+                    env_name, verbose=True, interactive=interactive, lib_loc=lib_loc
+                )
+            )
+            funcs, datasets = get_assets(env_name, module=self.__base_lib)
+            if settings.manifest_cache:
+                save_manifest(env_name, lib_loc, funcs=funcs, datasets=datasets)
 
-        funcs, datasets = get_assets(env_name, module=self.__base_lib)
         self.__set_rfuncs(funcs)
         self.__set_rdatasets(datasets)
 
+        register_library(env_name, lib_loc)
+        if workers is not None:
+            self.pool = RWorkerPool(workers)
+            # the worker processes are also stopped if the Renv is garbage collected
+            self.__pool_finalizer = weakref.finalize(
+                self, self.pool.shutdown, wait=False
+            )
+
         # Constants
         self.NULL = ro.NULL
         self.NA = ro.NA_Logical
@@ -73,6 +139,27 @@ class Renv:
 
         pinfo("Done!", verbose=True)
 
+    def close(self) -> None:
+        """
+        Shuts down the pool of R worker processes, if any, waiting for submitted calls.
+
+        Does nothing if the environment has no pool, or if it is already closed.
+        """
+        finalizer = self.__pool_finalizer
+        if self.pool is not None and finalizer is not None and finalizer.detach():
+            self.pool.shutdown()
+
+    def __enter__(self) -> "Renv":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
     def __set_base_lib(self, rpkg_: rpkg.Package) -> None:
         """
         Sets the base R package for the environment.
@@ -82,6 +169,24 @@ class Renv:
         """
         self.__base_lib = rpkg_
 
+    def __get_base_lib(self) -> rpkg.Package | None:
+        """
+        Gets the base R package for the environment, loading it if necessary.
+
+        Returns:
+            rpkg.Package | None: The R package, or None if the environment is not initialized.
+        """
+        if self.__base_lib is None and self.__env_name:
+            self.__set_base_lib(
+                try_load_namespace(
+                    self.__env_name,
+                    verbose=False,
+                    interactive=self.__interactive,
+                    lib_loc=self.__lib_loc,
+                )
+            )
+        return self.__base_lib
+
     def __set_rfuncs(self, funcs: set[str]) -> None:
         """
         Sets the available R functions for the environment.
@@ -130,47 +235,145 @@ class Renv:
 
         if name in self.__rfuncs:
             fun: Callable[..., RReturnType] = wrap_rfunc(
-                getattr(self.__base_lib, name), name=name
+                self.__get_rfunc(name),
+                name=self.__get_rname(name),
+                keep_in_r=self.__keep_in_r,
+                pool=self.pool,
             )
             self.__attach(name=name, attr=fun)
 
         elif name in self.__rdatasets:
-            self.__attach(name=name, attr=fetch_data(name, self.__base_lib))
+            self.__attach(name=name, attr=self.__fetch_data(name))
 
         else:
-            rfun: Callable[..., RReturnType] = rfunc(name)
+            rfun: Callable[..., RReturnType] = rfunc(
+                name, keep_in_r=self.__keep_in_r, pool=self.pool
+            )
             self.__attach(name=name, attr=rfun)
 
         return getattr(self, name)
 
-    def __function__(self, name: str, expr: str) -> None:
+    def __get_rfunc(self, name: str) -> Callable[..., Any]:
+        """
+        Gets an (unwrapped) R function, from the package or the global R environment.
+
+        Args:
+            name (str): The name of the R function.
+
+        Returns:
+            Callable[..., Any]: The R function.
+        """
+        if self.__rfuncs is None or name not in self.__rfuncs:
+            rfun_global: Callable[..., Any] = rcall(name)
+            return rfun_global
+        rfun: Callable[..., Any]
+        if self.__lazy:
+            exported: Any = rhelpers.get("exported_value")(
+                self.__env_name, self.__rnames[name]
+            )
+            rfun = ro.functions.SignatureTranslatedFunction(exported)
+        else:
+            rfun = getattr(self.__get_base_lib(), name)
+        return rfun
+
+    def __get_rname(self, name: str) -> str:
+        """
+        Gets the name used to call a function from R code, e.g., in lazy expressions.
+
+        Args:
+            name (str): The name of the R function in the environment.
+
+        Returns:
+            str: The name of the function, qualified with the package name if loaded lazily.
+        """
+        if self.__lazy and name in self.__rnames:
+            return f"{self.__env_name}::`{self.__rnames[name]}`"
+        return name
+
+    def __fetch_data(self, name: str) -> pd.DataFrame | RView | None:
+        """
+        Fetches a dataset of the package.
+
+        Args:
+            name (str): The name of the dataset in the environment.
+
+        Returns:
+            pd.DataFrame | RView | None: The dataset, or None if it could not be fetched.
+        """
+        if self.__lazy:
+            return fetch_lazydata(self.__env_name, self.__rnames[name])  # type: ignore[arg-type]
+        return fetch_data(name, self.__get_base_lib())
+
+    def memoize(
+        self, *names: str, cache: RCallCache | None = None, **kwargs: Any
+    ) -> RCallCache:
+        """
+        Memoizes calls to pure R functions in the environment.
+
+        Calls with identical arguments are only evaluated once in R, later calls
+        return the cached result. Only use this for functions without side effects.
+
+        Args:
+            *names (str): The names of the R functions to memoize.
+            cache (RCallCache | None): The cache to use. If None, a new cache
+                is created with `kwargs`. Defaults to None.
+            **kwargs (Any): Passed to `RCallCache` if `cache` is None, e.g., `maxsize` or `cache_dir`.
+
+        Returns:
+            RCallCache: The cache used by the memoized functions.
+
+        Raises:
+            ValueError: If the environment is not correctly initialized.
+        """
+        if self.__rfuncs is None or self.__rdatasets is None:
+            raise ValueError("Renv is not correctly initialized")
+
+        cache = cache if cache is not None else RCallCache(**kwargs)
+        for name in names:
+            fun: Callable[..., RReturnType] = wrap_rfunc(
+                self.__get_rfunc(name),
+                name=self.__get_rname(name),
+                cache=cache,
+                keep_in_r=self.__keep_in_r,
+                pool=self.pool,
+            )
+            self.__attach(name=name, attr=fun)
+        return cache
+
+    def __function__(self, name: str, expr: str, bytecompile: bool = False) -> None:
         """
         Attaches an R function to the environment.
 
         Args:
             name (str): The name of the function.
             expr (str): The R expression to create the function.
+            bytecompile (bool): If True, the function is byte-compiled. Defaults to False.
 
         Raises:
             ValueError: If the R expression does not correspond to a function.
         """
-        rfun: Callable[..., Any] | None = ro.r(
-            expr, invisible=True, print_r_warnings=False
-        )
+        rfun: Callable[..., Any] | None = rsources.function(expr, bytecompile)
         if rfun is None:
             raise ValueError(f"R object: {expr} is not a function")
 
         # Attach to the global namespace
-        rcall(f"{name} <- {expr}")
-        pyfunc: Callable[..., RReturnType] = wrap_rfunc(rfun, name=name)
+        ro.globalenv[name] = rfun
+        pyfunc: Callable[..., RReturnType] = wrap_rfunc(
+            rfun, name=name, keep_in_r=self.__keep_in_r, pool=self.pool
+        )
         self.__attach(name=name, attr=pyfunc)
 
-    def function(self, expr: str) -> Callable[..., Any]:
+    def function(self, expr: str, bytecompile: bool = False) -> Callable[..., Any]:
         """
         Creates a Python function from an R expression.
 
+        Function definitions (e.g., "function(x) x + 1") are parsed once per R
+        session, later calls with the same definition reuse the parsed function.
+        Other expressions are evaluated on every call.
+
         Args:
             expr (str): The R expression to convert into a function.
+            bytecompile (bool): If True, the function is byte-compiled. Defaults to False.
 
         Returns:
             Callable[..., Any]: A Python function equivalent to the R function.
@@ -178,13 +381,13 @@ class Renv:
         Raises:
             ValueError: If the R expression does not correspond to a function.
         """
-        rfun: Callable[..., Any] | None = ro.r(
-            expr, invisible=True, print_r_warnings=False
-        )
+        rfun: Callable[..., Any] | None = rsources.function(expr, bytecompile)
         if rfun is None:
             raise ValueError(f"R object: {expr} is not a function")
 
-        pyfunc: Callable[..., RReturnType] = wrap_rfunc(rfun, name=None)
+        pyfunc: Callable[..., RReturnType] = wrap_rfunc(
+            rfun, name=None, keep_in_r=self.__keep_in_r, pool=self.pool
+        )
         return pyfunc
 
     def print(self, x: Any) -> None:
@@ -194,13 +397,7 @@ class Renv:
         Args:
             x (Any): The object to print.
         """
-        foo: Callable[..., RReturnType] = rfunc(
-            """
-            function(x, ...) {
-                paste(utils::capture.output(print(x, ...)), collapse = "\n")
-            }
-            """
-        )
+        foo: Callable[..., RReturnType] = rhelpers.wrapped("capture.print")
         print(foo(x))
 
     def rclass(self, x: Any) -> RReturnType:
@@ -213,7 +410,7 @@ class Renv:
         Returns:
             RReturnType: The class of the object as in R.
         """
-        foo: Callable[..., RReturnType] = rfunc("class")
+        foo: Callable[..., RReturnType] = rhelpers.wrapped("class")
         return foo(x)
 
     def reval(self, expr: str, rview: bool | None = None) -> Any:
@@ -243,15 +440,20 @@ class Renv:
         path: str | pathlib.Path | None = None,
         code: str | None = None,
         extract: list[str] | None = None,
+        bytecompile: bool = False,
     ) -> None | RDict | Any:
         """
         Evaluates an R script. If extract is provided, extracts the specified objects from the R environment. If path is provided, reads the R script from the file.
         Else if code is provided, evaluates the R code directly. code and path cannot be provided at the same time.
 
+        The script is parsed once per R session. A script file is read again only if
+        its modification time or size has changed.
+
         Args:
             path (str | pathlib.Path | None): The path to the R script to evaluate. Defaults to None.
             code (str | None): The R code to evaluate. Defaults to None.
             extract (list[str]): A list of objects to extract from the R environment.
+            bytecompile (bool): If True, the script is byte-compiled. Defaults to False.
 
         Raises:
             ValueError: If both path and code are provided or if neither path nor code is provided.
@@ -267,52 +469,48 @@ class Renv:
             raise ValueError("Only one of path or code should be provided")
 
         if path is not None:
-            if isinstance(path, str):
-                path = pathlib.Path(path)
-
-            with open(path) as f:
-                code = f.read()
-
-        if extract:
-            list_args = [x[0] + "=" + x[1] for x in zip(extract, extract, strict=True)]
-            arg_sep = ", "  # define outside the fstring to avoid the type checker error
-            return_statement = f"list({arg_sep.join(list_args)})"
-        else:
-            return_statement = ""
-
-        sep = "\n"
-        header = "function() {"
-        ending = "}"
-
-        if (
+            source = rsources.script(pathlib.Path(path), extract)
+        elif (
             code is not None
         ):  # not necessary but the type checker is not able to infer this
-            fun: Callable[..., Any] = self.function(
-                header + sep + code + return_statement + sep + ending
-            )
-            return fun()
+            source = script_function(code, extract)
         else:
             return None
 
+        fun: Callable[..., Any] = self.function(source, bytecompile=bytecompile)
+        return fun()
+
 
 def fetch_data(
     dataset: str, module: rpkg.Package | None
 ) -> pd.DataFrame | RView | None:
     try:
         r_object = rpkg.data(module).fetch(dataset)[dataset]
-
-        if settings.rview_mode:
-            return RView(r_object)
-        else:
-            result = convert_r2py(r_object)
-            if not isinstance(result, pd.DataFrame):
-                raise ValueError(f"The provided dataset: {dataset} is not a DataFrame")
-            return result
+        return convert_dataset(dataset, r_object)
 
     except (KeyError, Exception):
         return None
 
 
+def fetch_lazydata(env_name: str, dataset: str) -> pd.DataFrame | RView | None:
+    try:
+        r_object = rhelpers.get("exported_value")(env_name, dataset, lazydata=True)
+        return convert_dataset(dataset, r_object)
+
+    except Exception:
+        return None
+
+
+def convert_dataset(dataset: str, r_object: Any) -> pd.DataFrame | RView:
+    if settings.rview_mode:
+        return RView(r_object)
+    else:
+        result = convert_r2py(r_object)
+        if not isinstance(result, pd.DataFrame):
+            raise ValueError(f"The provided dataset: {dataset} is not a DataFrame")
+        return result
+
+
 def get_assets(env_name: str, module: rpkg.Package | None) -> tuple[set[str], set[str]]:
     rcode: str = f'library({env_name}); ls("package:{env_name}")'
     # rcode: str = f"ls(\"package:{env_name}\")"
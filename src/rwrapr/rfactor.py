@@ -1,14 +1,21 @@
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import rpy2.rinterface as ri
 import rpy2.robjects as ro
 import rpy2.robjects.vectors as vc
-from rpy2.robjects import pandas2ri
+from numpy.typing import NDArray
 
-from .rattributes import get_rattributes
+from .rattributes import get_rattributes_direct
+from .rutils import get_rclass_fast
 from .toggle_rview import ToggleRView
 
 
+# R's NA_integer_, which is the smallest 32 bit integer
+RINT_NA: int = np.iinfo(np.int32).min
+
+
 class RFactor(pd.Series):
     def __init__(self, r_factor: ro.vectors.FactorVector):
         super().__init__(convert_rfactor2py(r_factor))  # type: ignore
@@ -24,17 +31,38 @@ class RFactor(pd.Series):
 
 
 def get_attributes_factor(df: vc.FactorVector) -> dict[str, Any] | None | Any:
-    return get_rattributes(df, exclude=["class", "levels"])
+    return get_rattributes_direct(df, exclude=["class", "levels"])
 
 
-def convert_categorical2r(series: pd.Series) -> ro.vectors.FactorVector | Any:
-    with (ro.default_converter + pandas2ri.converter).context():
-        r_factor = ro.conversion.get_conversion().py2rpy(series)
+def convert_categorical2r(
+    x: pd.Series | pd.Categorical,
+) -> ro.vectors.FactorVector | Any:
+    # Builds the R factor from the codes and categories, setting its levels
+    # and class through R's C-API
+    categorical = x.array if isinstance(x, pd.Series) else x
+    if not isinstance(categorical, pd.Categorical):
+        categorical = pd.Categorical(x)
 
-    return r_factor
+    # widen the (e.g., int8) codes first, such that NA is not wrapped around
+    codes = categorical.codes.astype(np.int32)
+    rcodes = np.where(codes < 0, RINT_NA, codes + 1)
+    r_factor = ri.IntSexpVector(rcodes)
+    r_factor.do_slot_assign(
+        "levels", ri.StrSexpVector([str(c) for c in categorical.categories])
+    )
+    rclass = ["ordered", "factor"] if categorical.ordered else ["factor"]
+    r_factor.do_slot_assign("class", ri.StrSexpVector(rclass))
+    return ro.vectors.FactorVector(r_factor)
 
 
 def convert_rfactor2py(r_factor: ro.vectors.FactorVector) -> pd.Series:
-    with (ro.default_converter + pandas2ri.converter).context():
-        series = ro.conversion.get_conversion().rpy2py(r_factor)
-    return pd.Series(series)
+    # R's codes start at 1, and NA is the smallest integer. pandas' start at 0,
+    # and NA is -1
+    rcodes = np.asarray(r_factor, dtype=np.int32)  # a view of the R vector
+    codes: NDArray[np.int32] = np.where(rcodes == RINT_NA, -1, rcodes - 1)
+    levels = pd.Index([str(level) for level in r_factor.do_slot("levels")])
+    rclass = get_rclass_fast(r_factor) or ()
+    categorical = pd.Categorical.from_codes(
+        codes, categories=levels, ordered="ordered" in rclass
+    )
+    return pd.Series(categorical)
@@ -0,0 +1,257 @@
+# Registry of the small R functions used internally by the conversion layer.
+# Each helper is parsed and evaluated once per embedded R session, instead of
+# once per conversion.
+from collections.abc import Callable
+from typing import Any
+
+import rpy2.rinterface as ri
+
+from .rutils import rcall
+
+
+RHELPER_SOURCES: dict[str, str] = {
+    "class": "class",
+    "as.matrix": "as.matrix",
+    "array": "array",
+    "structure": "structure",
+    "unname": "unname",
+    "readRDS": "readRDS",
+    "saveRDS": "saveRDS",
+    "object_size": "function(x) as.numeric(utils::object.size(x))",
+    "cmpfun": "function(f) if (is.function(f)) compiler::cmpfun(f) else f",
+    "serialize_call": """
+    function(.fun, ...) {
+        serialize(list(.fun, list(...)), connection = NULL, xdr = FALSE)
+    }
+    """,
+    "package_info": """
+    function(pkg, lib_loc) {
+        path <- find.package(pkg, lib.loc = lib_loc, quiet = TRUE)
+        if (length(path) == 0) return(NULL)
+        version <- read.dcf(file.path(path[1], "DESCRIPTION"), fields = "Version")
+        c(version[1, 1], path[1])
+    }
+    """,
+    "attach_package": """
+    function(pkg, lib_loc) {
+        library(pkg, lib.loc = lib_loc, character.only = TRUE)
+        invisible(NULL)
+    }
+    """,
+    "namespace_assets": """
+    function(pkg, lib_loc) {
+        if (!requireNamespace(pkg, lib.loc = lib_loc, quietly = TRUE)) return(NULL)
+
+        ns <- asNamespace(pkg)
+        exports <- getNamespaceExports(ns)
+        is_function <- vapply(exports, function(name) {
+            tryCatch(is.function(getExportedValue(ns, name)), error = function(e) FALSE)
+        }, logical(1), USE.NAMES = FALSE)
+        datasets <- ls(getNamespaceInfo(ns, "lazydata"), all.names = TRUE)
+
+        list(sort(exports[is_function]), sort(datasets))
+    }
+    """,
+    "exported_value": """
+    function(pkg, name, lazydata = FALSE) {
+        if (lazydata) get(name, envir = getNamespaceInfo(pkg, "lazydata"))
+        else getExportedValue(pkg, name)
+    }
+    """,
+    "arrow_available": """
+    function() requireNamespace("arrow", quietly = TRUE)
+    """,
+    "arrow_import": """
+    function(ptr) {
+        reader <- arrow::RecordBatchStreamReader$import_from_c(ptr)
+        out <- as.data.frame(reader$read_table())
+        rownames(out) <- as.character(seq_len(nrow(out)) - 1L)  # as pandas2ri
+        out
+    }
+    """,
+    "arrow_export": """
+    function(df, ptr) {
+        if (.row_names_info(df) > 0) return(FALSE)  # keep row names with pandas2ri
+        # only columns which pandas2ri converts to the same dtypes and values
+        same <- vapply(df, function(x) {
+            if (is.factor(x)) return(TRUE)
+            if (!is.null(attr(x, "class"))) return(FALSE)  # e.g., Date, POSIXct
+            is.double(x) || ((is.integer(x) || is.character(x)) && !anyNA(x))
+        }, logical(1))
+        if (!all(same)) return(FALSE)
+        reader <- arrow::as_record_batch_reader(arrow::arrow_table(df))
+        reader$export_to_c(ptr)
+        TRUE
+    }
+    """,
+    "slice_rows": """
+    function(df, start, end) {
+        out <- df[seq.int(start, end), , drop = FALSE]
+        if (.row_names_info(df) < 0) {  # keep automatic row names compact
+            attr(out, "row.names") <- .set_row_names(nrow(out))
+        }
+        out
+    }
+    """,
+    "automatic_row_names": "function(df) .row_names_info(df) < 0",
+    "map_call": """
+    function(.fun, .calls, .common) {
+        lapply(.calls, function(.args) do.call(.fun, c(.args, .common)))
+    }
+    """,
+    "do.call": "do.call",
+    "split_groups": """
+    function(.df, .by, .data_arg, .args) {
+        index <- unname(split(seq_len(nrow(.df)), .df[.by], drop = TRUE))
+        keys <- .df[vapply(index, `[`, integer(1), 1L), .by, drop = FALSE]
+        rownames(keys) <- NULL
+        calls <- lapply(index, function(i) {
+            part <- .df[i, , drop = FALSE]
+            if (is.null(.data_arg)) c(list(part), .args)
+            else c(setNames(list(part), .data_arg), .args)
+        })
+        list(keys, calls)
+    }
+    """,
+    "combine_groups": """
+    function(.keys, .results) {
+        if (!length(.results) || !all(vapply(.results, is.data.frame, logical(1)))) {
+            return(NULL)
+        }
+        parts <- lapply(seq_along(.results), function(i) {
+            result <- .results[[i]]
+            key_names <- setdiff(names(.keys), names(result))
+            if (!length(key_names)) return(result)
+            key <- .keys[rep(i, nrow(result)), key_names, drop = FALSE]
+            rownames(key) <- NULL
+            rownames(result) <- NULL
+            cbind(key, result)
+        })
+        out <- do.call(rbind, parts)
+        rownames(out) <- NULL
+        out
+    }
+    """,
+    "unserialize": "unserialize",
+    "eval_serialized_call": """
+    function(x) {
+        call <- unserialize(x)
+        serialize(do.call(call[[1]], call[[2]]), connection = NULL, xdr = FALSE)
+    }
+    """,
+    "attributes": """
+    function(x, exclude) {
+        attributes <- attributes(x)
+        if (is.null(attributes)) return(NULL)
+
+        attributes <- attributes[!names(attributes) %in% exclude]
+        if (length(attributes) == 0) return(NULL)
+
+        attributes
+    }
+    """,
+    "capture.print": """
+    function(x, ...) {
+        paste(utils::capture.output(print(x, ...)), collapse = "\n")
+    }
+    """,
+    "sparse_matrix": """
+    function(i, p, x, dims, dimnames) {
+        Matrix::sparseMatrix(i = i, p = p, x = x, dims = dims,
+                             dimnames = dimnames, index1 = FALSE)
+    }
+    """,
+    "s4_to_list": """
+    function(x) {
+      if (!isS4(x)) return(x)
+
+      slots = names(getSlots(class(x)))
+      structure(lapply(slots, function(name) slot(x, name)),
+                names = slots)
+    }
+    """,
+}
+
+
+def r_session_id() -> int:
+    # The global environment is recreated if the embedded R is re-initialised,
+    # so its address identifies the current R session
+    return int(ri.globalenv.rid)
+
+
+class RHelperRegistry:
+    """
+    Registry of R helper functions, parsed once per embedded R session.
+
+    Helpers are looked up by name, and compiled lazily on first use. If the
+    embedded R is re-initialised, all compiled helpers are discarded and
+    recompiled on their next use.
+    """
+
+    def __init__(self, sources: dict[str, str]) -> None:
+        self._sources: dict[str, str] = dict(sources)
+        self._compiled: dict[str, Any] = {}
+        self._wrapped: dict[str, Callable[..., Any]] = {}
+        self._session: int | None = None
+
+    def register(self, name: str, source: str) -> None:
+        """
+        Registers (or replaces) an R helper function.
+
+        Args:
+            name (str): The name used to look up the helper.
+            source (str): R code evaluating to a function.
+        """
+        self._sources[name] = source
+        self._compiled.pop(name, None)
+        self._wrapped.pop(name, None)
+
+    def clear(self) -> None:
+        """Discards all compiled helpers, they are recompiled on next use."""
+        self._compiled.clear()
+        self._wrapped.clear()
+        self._session = None
+
+    def _check_session(self) -> None:
+        session = r_session_id()
+        if session != self._session:
+            self.clear()
+            self._session = session
+
+    def get(self, name: str) -> Any:
+        """
+        Gets the compiled R function, without any conversion of arguments or results.
+
+        Args:
+            name (str): The name of the helper.
+
+        Returns:
+            Any: The R function.
+
+        Raises:
+            KeyError: If no helper is registered under `name`.
+        """
+        self._check_session()
+        if name not in self._compiled:
+            self._compiled[name] = rcall(self._sources[name])
+        return self._compiled[name]
+
+    def wrapped(self, name: str) -> Callable[..., Any]:
+        """
+        Gets the R function wrapped with `wrap_rfunc`, converting arguments and results.
+
+        Args:
+            name (str): The name of the helper.
+
+        Returns:
+            Callable[..., Any]: The wrapped R function.
+        """
+        from .function_wrapper import wrap_rfunc
+
+        rfun = self.get(name)  # checks the session, and may clear self._wrapped
+        if name not in self._wrapped:
+            self._wrapped[name] = wrap_rfunc(rfun, name=None, cache=False, traced=False)
+        return self._wrapped[name]
+
+
+rhelpers: RHelperRegistry = RHelperRegistry(RHELPER_SOURCES)
@@ -1,14 +1,16 @@
 from collections import OrderedDict
 from collections import UserDict
 from collections import UserList
-from collections.abc import Callable
+from collections.abc import Iterator
 from typing import Any
 
 import numpy as np
+import rpy2.rinterface as ri
 import rpy2.robjects as ro
 import rpy2.robjects.vectors as vc
+from numpy.typing import NDArray
 
-from .rutils import rcall
+from .settings import settings
 from .toggle_rview import ToggleRView
 
 
@@ -70,6 +72,185 @@ class RDict(UserDict[str, Any]):
 DictTypes = dict[str, Any] | OrderedDict[str, Any] | UserDict[str, Any] | RDict
 
 
+class LazyRList(RList):
+    """
+    An RList converting the elements of the R list on first access.
+
+    Converted elements are memoised. Operations needing all elements (e.g.,
+    modifying the list, or `to_py()`) convert the whole list. If the list is
+    never fully converted, `to_r()` returns the original R list, so in-place
+    modifications of its elements are not seen by R.
+    """
+
+    def __init__(self, x: vc.ListVector | vc.ListSexpVector) -> None:
+        self._robj = x
+        self._converted: dict[int, Any] = {}
+        self._data: list[Any] | None = None
+        self._attributes: dict[str, Any] | None = None
+        self._attributes_loaded = False
+
+    @property
+    def data(self) -> list[Any]:
+        if self._data is None:
+            self._data = [self._convert(i) for i in range(len(self._robj))]
+        return self._data
+
+    @data.setter
+    def data(self, value: list[Any]) -> None:
+        self._data = value
+
+    @property
+    def _rattributes(self) -> dict[str, Any] | None:
+        if not self._attributes_loaded:
+            self._attributes = get_lazy_rattributes(self._robj)
+            self._attributes_loaded = True
+        return self._attributes
+
+    @_rattributes.setter
+    def _rattributes(self, value: dict[str, Any] | None) -> None:
+        self._attributes = value
+        self._attributes_loaded = True
+        self.data  # the R object no longer matches  # noqa: B018
+
+    def _convert(self, i: int) -> Any:
+        from .convert_r2py import convert_r2py
+
+        if i not in self._converted:
+            self._converted[i] = convert_r2py(self._robj[i])
+        return self._converted[i]
+
+    def __getitem__(self, i: Any) -> Any:
+        if self._data is not None:
+            return self._data[i]
+        if isinstance(i, slice):
+            return RList(
+                [self._convert(j) for j in range(*i.indices(len(self)))],
+                attributes=None,
+            )
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("list index out of range")
+        return self._convert(i)
+
+    def __len__(self) -> int:
+        return len(self._data) if self._data is not None else len(self._robj)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._data is not None:
+            return iter(self._data)
+        return (self._convert(i) for i in range(len(self._robj)))
+
+    def __contains__(self, item: Any) -> bool:
+        return any(x is item or x == item for x in self)
+
+    def force(self) -> "LazyRList":
+        """Converts all elements, including elements of nested lazy lists."""
+        for x in self.data:
+            if isinstance(x, LazyRList | LazyRDict):
+                x.force()
+        return self
+
+    def to_r(self) -> Any:
+        if self._data is None:
+            return self._robj
+        return super().to_r()
+
+    def to_py(self) -> list[Any]:
+        self.force()
+        return super().to_py()
+
+
+class LazyRDict(RDict):
+    """
+    An RDict converting the elements of the (named) R list on first access.
+
+    Converted elements are memoised. Operations needing all elements (e.g.,
+    modifying the dict, or `to_py()`) convert the whole dict. If the dict is
+    never fully converted, `to_r()` returns the original R list, so in-place
+    modifications of its elements are not seen by R.
+    """
+
+    def __init__(self, x: vc.ListVector | vc.ListSexpVector, names: list[str]) -> None:
+        self._robj = x
+        # duplicated names refer to the last element, as when building a dict
+        self._index: dict[str, int] = {name: i for i, name in enumerate(names)}
+        self._converted: dict[str, Any] = {}
+        self._data: dict[str, Any] | None = None
+        self._attributes: dict[str, Any] | None = None
+        self._attributes_loaded = False
+
+    @property
+    def data(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = {key: self._convert(key) for key in self._index}
+        return self._data
+
+    @data.setter
+    def data(self, value: dict[str, Any]) -> None:
+        self._data = value
+
+    @property
+    def _rattributes(self) -> dict[str, Any] | None:
+        if not self._attributes_loaded:
+            self._attributes = get_lazy_rattributes(self._robj)
+            self._attributes_loaded = True
+        return self._attributes
+
+    @_rattributes.setter
+    def _rattributes(self, value: dict[str, Any] | None) -> None:
+        self._attributes = value
+        self._attributes_loaded = True
+        self.data  # the R object no longer matches  # noqa: B018
+
+    def _convert(self, key: str) -> Any:
+        from .convert_r2py import convert_r2py
+
+        if key not in self._converted:
+            self._converted[key] = convert_r2py(self._robj[self._index[key]])
+        return self._converted[key]
+
+    def __getitem__(self, key: str) -> Any:
+        if self._data is not None:
+            return self._data[key]
+        if key not in self._index:
+            raise KeyError(key)
+        return self._convert(key)
+
+    def __len__(self) -> int:
+        return len(self._data) if self._data is not None else len(self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data if self._data is not None else self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in (self._data if self._data is not None else self._index)
+
+    def force(self) -> "LazyRDict":
+        """Converts all elements, including elements of nested lazy lists."""
+        for x in self.data.values():
+            if isinstance(x, LazyRList | LazyRDict):
+                x.force()
+        return self
+
+    def to_r(self) -> Any:
+        if self._data is None:
+            return self._robj
+        return super().to_r()
+
+    def to_py(self) -> dict[str, Any]:
+        self.force()
+        return super().to_py()
+
+
+def get_lazy_rattributes(x: vc.ListVector | vc.ListSexpVector) -> dict[str, Any] | None:
+    from .rattributes import get_rattributes
+
+    with ToggleRView(False):
+        attributes = get_rattributes(x, exclude=["names"])
+    return dict(attributes) if attributes is not None else None
+
+
 def convert_r2pylist(x_collection: ListTypes) -> list[Any] | tuple[Any]:
     from .convert_r2py import convert_r2py
 
@@ -94,6 +275,11 @@ def convert_rlist2py(x_collection: vc.ListVector | vc.ListSexpVector) -> Any:
             names = names.astype(fill.dtype)
         names[names == ""] = fill[names == ""]
 
+    if settings.lazy_lists:
+        if names is not None and len(names) and not np.any(names == ""):
+            return LazyRDict(x_collection, names=names.tolist())
+        return LazyRList(x_collection)
+
     attributes = get_rattributes(x_collection, exclude=["names"])
 
     if attributes is not None:
@@ -137,6 +323,47 @@ def dict2rlist(x: DictTypes) -> ro.ListVector:
 
 
 def pylist2rlist(x: ListTypes) -> ro.ListVector:
-    y: dict[str, Any] = {str(k): v for k, v in enumerate(x)}
-    unname: Callable[..., Any] = rcall("unname")
-    return unname(dict2rlist(y))
+    from .convert_py2r import convert_py2r
+
+    # an unnamed R list, allocated once
+    py2rpy = ro.conversion.get_conversion().py2rpy
+    return ro.ListVector(ri.ListSexpVector([py2rpy(convert_py2r(v)) for v in x]))
+
+
+# Python types which can be collected in an atomic R vector, by numpy dtype kind
+ATOMIC_KINDS: dict[type[Any], str] = {bool: "b", int: "i", float: "f", str: "U"}
+
+
+def atomic_kind(x: list[Any]) -> str | None:
+    kinds: set[str | None] = set()
+    for t in set(map(type, x)):
+        if issubclass(t, np.generic):
+            kinds.add(np.dtype(t).kind)
+        else:
+            kinds.add(ATOMIC_KINDS.get(t))
+
+    if kinds == {"i", "f"}:
+        return "f"  # as in R, c(1L, 2.5) is a double vector
+    if len(kinds) == 1 and kinds <= {"b", "i", "f", "U"}:
+        return kinds.pop()
+    return None
+
+
+def pylist2rvector(x: ListTypes) -> Any:
+    # Homogeneous lists of bools, ints, floats or strings are converted to an
+    # atomic R vector in one go, other lists to an R list
+    from .rarray import convert_numpy1D
+
+    values = x if isinstance(x, list) else list(x)
+    kind = atomic_kind(values) if values else None
+    if kind is not None:
+        y = np.array(values)
+        if y.dtype.kind == kind and (kind != "i" or fits_rint(y)):
+            return convert_numpy1D(y)
+    return pylist2rlist(values)
+
+
+def fits_rint(x: NDArray[np.integer[Any]]) -> bool:
+    # R integers are 32 bit, with the smallest value reserved for NA
+    info = np.iinfo(np.int32)
+    return bool(x.min() > info.min and x.max() <= info.max)
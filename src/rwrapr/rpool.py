@@ -0,0 +1,214 @@
+# Pool of worker processes, each with its own embedded R session, for running
+# independent calls to R functions in parallel. Calls (the R function and its
+# arguments) and results are serialized with R's `serialize`, and passed
+# between the processes through shared memory.
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+import rpy2.rinterface as ri
+
+from .rhelpers import rhelpers
+from .settings import settings
+
+
+# Packages loaded with `library()`, which are attached in new workers
+loaded_libraries: dict[str, str | None] = {}
+
+
+def register_library(env_name: str, lib_loc: str | None) -> None:
+    loaded_libraries[env_name] = lib_loc
+
+
+def write_shm(data: Any) -> tuple[str, int]:
+    # copies the bytes of data into a new shared memory block
+    view = np.asarray(data, dtype=np.uint8)
+    shm = shared_memory.SharedMemory(create=True, size=max(view.size, 1))
+    assert shm.buf is not None  # only None after the block is closed
+    np.frombuffer(shm.buf, dtype=np.uint8, count=view.size)[:] = view
+    name = shm.name
+    shm.close()
+    return name, view.size
+
+
+def read_shm(name: str, size: int, unlink: bool, rraw: bool = False) -> Any:
+    # copies the shared memory block into bytes, or an R raw vector if rraw.
+    # R must only be called from the thread running the embedded R
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        assert shm.buf is not None  # only None after the block is closed
+        with shm.buf[:size] as buf:  # released before the block is closed
+            data: Any = ri.ByteSexpVector(buf) if rraw else bytes(buf)
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+    return data
+
+
+def init_worker(libraries: dict[str, str | None]) -> None:
+    import rpy2.robjects as ro
+
+    for env_name, lib_loc in libraries.items():
+        rhelpers.get("attach_package")(
+            env_name, ro.NULL if lib_loc is None else lib_loc
+        )
+
+
+def run_call(name: str, size: int) -> tuple[str, int]:
+    call = read_shm(name, size, unlink=False, rraw=True)  # unlinked by the caller
+    result = rhelpers.get("eval_serialized_call")(call)
+    return write_shm(result)
+
+
+class RFuture:
+    """
+    The result of an R function call running in an `RWorkerPool`.
+
+    The result is converted to Python in the thread calling `result()`.
+    """
+
+    def __init__(self, future: Future[tuple[str, int]], keep_in_r: bool) -> None:
+        self._future = future
+        self._keep_in_r = keep_in_r
+        self._collected = threading.Event()
+        self._data: bytes = b""
+
+    def _collect(self, future: Future[tuple[str, int]]) -> None:
+        # copy the result out of shared memory as soon as it is ready, such
+        # that the block is freed even if the result is never requested.
+        # Runs in a thread of the executor, so R must not be called here
+        try:
+            if not future.cancelled() and future.exception() is None:
+                self._data = read_shm(*future.result(), unlink=True)
+        finally:
+            self._collected.set()
+
+    def done(self) -> bool:
+        """Returns True if the call has finished or was cancelled."""
+        return self._future.done()
+
+    def cancel(self) -> bool:
+        """Attempts to cancel the call, returns True if it was cancelled."""
+        return self._future.cancel()
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        """Returns the exception raised by the call, if any."""
+        return self._future.exception(timeout)
+
+    def result(self, timeout: float | None = None) -> Any:
+        """
+        Waits for the call to finish, and returns its result.
+
+        Args:
+            timeout (float | None): The maximum number of seconds to wait. Defaults to None (no limit).
+
+        Returns:
+            Any: The result, converted to Python, or as an RView if `keep_in_r`
+                or `settings.rview_mode` is set.
+
+        Raises:
+            TimeoutError: If the call did not finish within `timeout` seconds.
+        """
+        from .convert_r2py import convert_r2py
+        from .rview import RView
+
+        self._future.result(timeout)  # raises the exception of the call, if any
+        self._collected.wait()
+        r_object = rhelpers.get("unserialize")(ri.ByteSexpVector(self._data))
+        if self._keep_in_r or settings.rview_mode:
+            return RView(r_object)
+        else:
+            return convert_r2py(r_object)
+
+
+class RWorkerPool:
+    """
+    A pool of worker processes, each running its own embedded R session.
+
+    Packages loaded with `library()` before the pool is created are attached
+    in each worker. Functions must not depend on objects in the global R
+    environment, as these are not available in the workers.
+    """
+
+    def __init__(
+        self, workers: int, libraries: dict[str, str | None] | None = None
+    ) -> None:
+        """
+        Initializes the pool. The worker processes are started on the first submitted call.
+
+        Args:
+            workers (int): The number of worker processes.
+            libraries (dict[str, str | None] | None): The packages to attach in each worker,
+                mapped to their library location. Defaults to all packages loaded with `library()`.
+        """
+        libraries = dict(loaded_libraries) if libraries is None else libraries
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+            initargs=(libraries,),
+        )
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        args: list[Any],
+        kwargs: dict[str, Any],
+        keep_in_r: bool = False,
+    ) -> RFuture:
+        """
+        Submits a call of an R function to the pool.
+
+        Args:
+            func (Callable[..., Any]): The R function.
+            args (list[Any]): The positional arguments, converted to R.
+            kwargs (dict[str, Any]): The keyword arguments, converted to R.
+            keep_in_r (bool): If True, the result is returned as an RView. Defaults to False.
+
+        Returns:
+            RFuture: The future result of the call.
+        """
+        call = rhelpers.get("serialize_call")(func, *args, **kwargs)
+        name, size = write_shm(call)
+
+        future = self.executor.submit(run_call, name, size)
+        rfuture = RFuture(future, keep_in_r=keep_in_r)
+
+        def cleanup(future: Future[tuple[str, int]]) -> None:
+            shm = shared_memory.SharedMemory(name=name)
+            shm.close()
+            shm.unlink()
+            rfuture._collect(future)
+
+        future.add_done_callback(cleanup)
+        return rfuture
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the worker processes.
+
+        Args:
+            wait (bool): If True, waits for the submitted calls to finish. Defaults to True.
+        """
+        self.executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self) -> RWorkerPool:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.shutdown()
@@ -0,0 +1,137 @@
+# Cache of R functions parsed from R source code, such that scripts and
+# functions which are run repeatedly are parsed (and byte-compiled) once per
+# embedded R session.
+from __future__ import annotations
+
+import hashlib
+import pathlib
+import re
+from collections import OrderedDict
+from typing import Any
+
+from .rhelpers import r_session_id
+from .rhelpers import rhelpers
+from .rutils import rcall
+
+
+# A function definition, e.g., "function(x) x + 1" or "\(x) x + 1". Evaluating
+# other code (e.g., a name, or `local({...})`) may give a different object each
+# time, such that it is not cached
+FUNCTION_DEFINITION: re.Pattern[str] = re.compile(r"^\s*(function|\\)\s*\(")
+
+
+def script_function(code: str, extract: list[str] | None = None) -> str:
+    # R source of a function running the code of a script, and returning the
+    # objects in extract as a named list
+    if extract:
+        list_args = [name + "=" + name for name in extract]
+        return_statement = f"list({', '.join(list_args)})"
+    else:
+        return_statement = ""
+
+    sep = "\n"
+    return "function() {" + sep + code + sep + return_statement + sep + "}"
+
+
+class RSourceCache:
+    """
+    Cache of R functions parsed from R source code.
+
+    Function definitions are keyed on a hash of their source, and on whether
+    they are byte-compiled (with `compiler::cmpfun`). Other sources are
+    evaluated on every use. The R source of scripts is keyed
+    on their path, modification time and size, such that unchanged scripts
+    are neither read nor parsed again. If the embedded R is re-initialised,
+    all parsed functions are discarded.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            maxsize (int): The maximum number of functions (and scripts) kept. Defaults to 256.
+        """
+        self.maxsize = maxsize
+        self._functions: OrderedDict[tuple[str, bool], Any] = OrderedDict()
+        self._scripts: OrderedDict[tuple[str, int, int, tuple[str, ...]], str] = (
+            OrderedDict()
+        )
+        self._session: int | None = None
+
+    def clear(self) -> None:
+        """Discards all cached functions and scripts."""
+        self._functions.clear()
+        self._scripts.clear()
+        self._session = None
+
+    def function(self, source: str, bytecompile: bool = False) -> Any:
+        """
+        Gets the R function evaluated from R source code.
+
+        Function definitions (e.g., "function(x) x + 1") are parsed on first use
+        only. Other sources (e.g., the name of a function) are evaluated each time,
+        such that redefined functions and fresh closures are not reused.
+
+        Args:
+            source (str): R code evaluating to a function.
+            bytecompile (bool): If True, the function is byte-compiled. Defaults to False.
+
+        Returns:
+            Any: The R function (or whatever the source evaluates to).
+        """
+        session = r_session_id()
+        if session != self._session:
+            self._functions.clear()
+            self._session = session
+
+        if not FUNCTION_DEFINITION.match(source):
+            value = rcall(source)
+            return rhelpers.get("cmpfun")(value) if bytecompile else value
+
+        key = (hashlib.sha256(source.encode()).hexdigest(), bytecompile)
+        if key in self._functions:
+            self._functions.move_to_end(key)
+            return self._functions[key]
+
+        rfun = rcall(source)
+        if bytecompile:
+            rfun = rhelpers.get("cmpfun")(rfun)
+
+        self._functions[key] = rfun
+        if len(self._functions) > self.maxsize:
+            self._functions.popitem(last=False)
+        return rfun
+
+    def script(self, path: pathlib.Path, extract: list[str] | None = None) -> str:
+        """
+        Gets the R source of a function running an R script, see `script_function`.
+
+        Args:
+            path (pathlib.Path): The path to the R script.
+            extract (list[str] | None): The objects returned by the function. Defaults to None.
+
+        Returns:
+            str: The R source of the function.
+        """
+        stat = path.stat()
+        key = (
+            str(path.resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            tuple(extract) if extract else (),
+        )
+        if key in self._scripts:
+            self._scripts.move_to_end(key)
+            return self._scripts[key]
+
+        with open(path) as f:
+            source = script_function(f.read(), extract)
+
+        self._scripts[key] = source
+        if len(self._scripts) > self.maxsize:
+            self._scripts.popitem(last=False)
+        return source
+
+
+rsources: RSourceCache = RSourceCache()
@@ -1,9 +1,11 @@
 from collections.abc import Callable
+from collections.abc import Iterable
 from typing import Any
 
 import numpy as np
 import rpy2.robjects as ro
 from numpy.typing import NDArray
+from rpy2.rinterface_lib.sexp import Sexp
 
 
 supported_classes = {"list", "array", "matrix", "vector", "atomic"}
@@ -13,11 +15,26 @@ def rcall(expr: str) -> Any:
     return ro.r(expr, print_r_warnings=False, invisible=True)
 
 
+def get_rclass_fast(x: Any) -> tuple[str, ...] | None:
+    # Reads the class of R objects through the C-API (as R's class()), without
+    # an R call. Returns None if x is not an R object
+    if not isinstance(x, Sexp):
+        return None
+    try:
+        return tuple(x.rclass)
+    except Exception:
+        return None
+
+
 def get_rclass(x: Any) -> NDArray[np.str_] | None:
-    from .function_wrapper import rfunc
+    from .rhelpers import rhelpers
+
+    rclass = get_rclass_fast(x)
+    if rclass is not None:
+        return np.asarray(rclass, dtype="U")
 
     try:
-        f: Callable[..., Any] | Any = rfunc("class")
+        f: Callable[..., Any] | Any = rhelpers.wrapped("class")
         return np.asarray(f(x), dtype="U")
     except Exception:
         return None
@@ -29,17 +46,20 @@ def has_unsupported_rclass(x: Any) -> bool:
     if rclass is None or len(rclass.tolist()) == 0:
         return False
     if isinstance(rclass.tolist(), str):
-        rclass = {rclass.tolist()}
+        return is_unsupported_rclass([rclass.tolist()])
     else:
-        rclass = set(rclass.tolist())
+        return is_unsupported_rclass(rclass.tolist())
+
 
-    return len(rclass) > 0 and not rclass.issubset(supported_classes)
+def is_unsupported_rclass(rclass: Iterable[str]) -> bool:
+    rclass_set = set(rclass)
+    return len(rclass_set) > 0 and not rclass_set.issubset(supported_classes)
 
 
 def as_matrix(x: Any) -> NDArray[Any] | Any:
-    from .function_wrapper import rfunc
+    from .rhelpers import rhelpers
 
-    f: Callable[..., Any] | Any = rfunc("as.matrix")
+    f: Callable[..., Any] | Any = rhelpers.wrapped("as.matrix")
     return f(x)
 
 
@@ -4,15 +4,14 @@ from collections.abc import Iterator
 from typing import Any
 
 import rpy2.robjects as ro
-import scipy  # type: ignore
 
 from .nputils import np_collapse
 from .rlist import RDict
 from .rlist import RList
-from .rutils import as_matrix
 from .rutils import get_rclass
 from .rutils import has_unsupported_rclass
-from .rutils import rcall
+from .sparse import SPARSE_RCLASSES
+from .sparse import convert_rsparsematrix
 from .toggle_rview import ToggleRView
 
 
@@ -68,22 +67,11 @@ class RView:
         return self.robj
 
 
-s4_to_list_r: Callable[..., Any] | Any = rcall(
-    """
-    function(x) {
-      if (!isS4(x)) return(x)
-
-      slots = names(getSlots(class(x)))
-      structure(lapply(slots, function(name) slot(x, name)),
-                names = slots)
-    }
-"""
-)
-
-
 def s4_to_list(x: ro.methods.RS4) -> Any:
     from .convert_r2py import convert_r2py
+    from .rhelpers import rhelpers
 
+    s4_to_list_r: Callable[..., Any] = rhelpers.get("s4_to_list")
     with ToggleRView(False):
         out = convert_r2py(s4_to_list_r(x))
 
@@ -91,17 +79,13 @@ def s4_to_list(x: ro.methods.RS4) -> Any:
 
 
 def convert_s4(x: ro.methods.RS4, ignore_s4: bool) -> Any:
-    from .rarray import convert_numpy
-
     rclass = get_rclass(x)
     if rclass is None:
         return RView(x)
 
     match np_collapse(rclass):
-        case "dgCMatrix":  # todo: put this in a separate function
-            dense = convert_numpy(as_matrix(x))
-            sparse = scipy.sparse.coo_matrix(dense)
-            return sparse
+        case name if name in SPARSE_RCLASSES:
+            return convert_rsparsematrix(x, name)
         case _ if not ignore_s4:
             return RView(x)
         case _:
@@ -1,17 +1,110 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+from typing import overload
+
+
+if TYPE_CHECKING:
+    from .argcache import ArgCache
+    from .rcache import RCallCache
+
+
+T = TypeVar("T")
+
+_UNSET: Any = object()
+
+
+class Setting(Generic[T]):
+    """
+    A setting with a process-wide value, which can be overridden per context.
+
+    Overrides (see `Settings.override`) are stored in a `ContextVar`, such that
+    they only apply to the current thread or asyncio task, and to contexts
+    copied from it. Without an override, the process-wide value is used.
+    """
+
+    def __init__(self, default: T) -> None:
+        self.default = default
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.context_var: ContextVar[Any] = ContextVar(f"rwrapr_{name}", default=_UNSET)
+
+    @overload
+    def __get__(self, obj: None, objtype: type | None = None) -> Setting[T]: ...
+
+    @overload
+    def __get__(self, obj: object, objtype: type | None = None) -> T: ...
+
+    def __get__(self, obj: object | None, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        value = self.context_var.get()
+        if value is _UNSET:
+            return obj.__dict__.get(self.name, self.default)
+        return value
+
+    def __set__(self, obj: object, value: T) -> None:
+        obj.__dict__[self.name] = value
+
 
 class Settings:
     _instance: Settings | None = None  # Singleton instance of the class
 
+    rview_mode: Setting[bool] = Setting(False)
+    zero_copy: Setting[bool] = Setting(False)
+    call_cache: Setting[RCallCache | None] = Setting(None)
+    manifest_cache: Setting[bool] = Setting(False)
+    arrow_transfer: Setting[bool] = Setting(True)
+    arg_cache: Setting[ArgCache | None] = Setting(None)
+    lazy_lists: Setting[bool] = Setting(False)
+
     def __new__(cls) -> Settings:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
-        if not hasattr(self, "rview_mode"):  # Check if already initialized
-            self.rview_mode = False
+    @contextmanager
+    def override(self, **kwargs: Any) -> Iterator[Settings]:
+        """Override settings within a `with` block, in the current context only.
+
+        Unlike the `set_*` methods, which change the process-wide value of a
+        setting, overrides only apply to the current thread or asyncio task
+        (and to contexts copied from it, e.g., calls run by `RExecutor`), so
+        concurrent callers do not see each other's overrides.
+
+        Example:
+            >>> with settings.override(rview_mode=True):
+            ...     pass
+
+        Args:
+            **kwargs: The settings to override, and their values within the block.
+
+        Yields:
+            The settings.
+
+        Raises:
+            AttributeError: If one of the names is not a setting.
+        """
+        overrides: list[tuple[Setting[Any], Any]] = []
+        for name in kwargs:
+            if not isinstance(type(self).__dict__.get(name), Setting):
+                raise AttributeError(f"Unknown setting: {name}")
+
+        try:
+            for name, value in kwargs.items():
+                setting: Setting[Any] = type(self).__dict__[name]
+                overrides.append((setting, setting.context_var.set(value)))
+            yield self
+        finally:
+            for setting, token in reversed(overrides):
+                setting.context_var.reset(token)
 
     def set_rview_mode(self, rview_mode: bool) -> None:
         """Set the rview_mode attribute to the specified value.
@@ -28,6 +121,94 @@ class Settings:
         """
         self.rview_mode = rview_mode
 
+    def set_zero_copy(self, zero_copy: bool) -> None:
+        """Set the zero_copy attribute to the specified value.
+
+        If `True`, numeric (double and integer) R vectors, matrices and arrays
+        are converted to `RArray` objects which are read-only views of the
+        memory owned by R, instead of copies. The R object is kept alive for
+        as long as the array (or any view of it) is alive. Matrices and arrays
+        keep R's column-major layout, and are exposed as Fortran-ordered arrays.
+        Integer vectors keep R's 32-bit integer type. Use `.copy()` to get a
+        writeable array.
+
+        Args:
+            zero_copy: A boolean value indicating whether to enable (True)
+                or disable (False) zero-copy conversion of R vectors.
+        """
+        self.zero_copy = zero_copy
+
+    def set_call_cache(self, call_cache: RCallCache | None) -> None:
+        """Set the call_cache attribute to the specified cache.
+
+        If set, all calls to wrapped R functions are memoized in the cache.
+        See also `Memoize`, which sets the cache within a `with` block, and
+        `Renv.memoize`, which memoizes specific functions.
+
+        Args:
+            call_cache: The cache to use, or None to disable memoization.
+        """
+        self.call_cache = call_cache
+
+    def set_manifest_cache(self, manifest_cache: bool) -> None:
+        """Set the manifest_cache attribute to the specified value.
+
+        If `True`, the functions and datasets of R packages are cached on disk,
+        keyed by the name, version and path of the package. When a cached
+        package is loaded again, `Renv` skips scanning the package, and the
+        package's functions are not translated until first accessed. The cache
+        is stored in `$RWRAPR_CACHE_DIR/manifests`, or `~/.cache/rwrapr/manifests`
+        if the environment variable is not set. Defaults to `False`.
+
+        Args:
+            manifest_cache: A boolean value indicating whether to enable (True)
+                or disable (False) the on-disk manifest cache.
+        """
+        self.manifest_cache = manifest_cache
+
+    def set_arrow_transfer(self, arrow_transfer: bool) -> None:
+        """Set the arrow_transfer attribute to the specified value.
+
+        If `True`, data frames are transferred between pandas and R through
+        the Arrow C stream interface, when both `pyarrow` and the R package
+        `arrow` are installed. Numeric columns are then shared in bulk, and
+        string and categorical columns are transferred without converting
+        each element. Data frames with row names (or a non-default index)
+        are always converted with the `pandas2ri` converter, which is also
+        used if the Arrow transfer fails.
+
+        Args:
+            arrow_transfer: A boolean value indicating whether to enable (True)
+                or disable (False) Arrow transfer of data frames.
+        """
+        self.arrow_transfer = arrow_transfer
+
+    def set_arg_cache(self, arg_cache: ArgCache | None) -> None:
+        """Set the arg_cache attribute to the specified cache.
+
+        If set, large DataFrames and arrays passed to wrapped R functions are
+        converted once, and the R object is reused as long as the Python
+        object is alive and unchanged.
+
+        Args:
+            arg_cache: The cache to use, or None to convert all arguments on every call.
+        """
+        self.arg_cache = arg_cache
+
+    def set_lazy_lists(self, lazy_lists: bool) -> None:
+        """Set the lazy_lists attribute to the specified value.
+
+        If `True`, R lists are converted to `LazyRList` and `LazyRDict`
+        objects, which convert each element of the R list when it is first
+        accessed, e.g., `result["modelMatrix"]`, instead of converting the
+        whole list up front. Use `.to_py()` to convert all elements.
+
+        Args:
+            lazy_lists: A boolean value indicating whether to enable (True)
+                or disable (False) lazy conversion of R lists.
+        """
+        self.lazy_lists = lazy_lists
+
 
 # Singleton instance of Settings
 settings: Settings = Settings()
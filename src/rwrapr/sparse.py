@@ -1,20 +1,96 @@
+from __future__ import annotations
+
 from collections.abc import Callable
 from typing import Any
 
+import numpy as np
 import rpy2.robjects as ro
 import scipy  # type: ignore
+from numpy.typing import NDArray
+from rpy2.rinterface_lib.sexp import NULLType
+
+from .toggle_rview import ToggleRView
+
+# Sparse matrix classes from the Matrix package, which are read directly from
+# their slots. The first letter gives the type of the non-zero entries
+# (double, logical or pattern), the third the storage (column-compressed or triplet)
+SPARSE_RCLASSES = {
+    "dgCMatrix",
+    "lgCMatrix",
+    "ngCMatrix",
+    "dgTMatrix",
+    "lgTMatrix",
+    "ngTMatrix",
+}
+
+
+class RSparseArray(scipy.sparse.csc_array):  # type: ignore
+    # Arrays created by scipy operations on an RSparseArray have no R attributes
+    _rattributes: dict[str, Any] | None = None
+
+    def to_r(self) -> Any:
+        return convert_pysparsematrix(self)
+
+    def to_py(self) -> scipy.sparse.csc_array:
+        with ToggleRView(False):
+            out = scipy.sparse.csc_array(self)
+        return out
+
 
+def convert_rsparsematrix(x: ro.methods.RS4, rclass: str) -> RSparseArray:
+    shape = tuple(int(d) for d in x.do_slot("Dim"))
+    i = np.array(x.do_slot("i"), dtype=np.int32)
 
-def convert_pysparsematrix(x: scipy.sparse.coo_array | scipy.sparse.coo_matrix) -> Any:
-    from .rutils import rcall
+    match rclass[0]:
+        case "d":
+            data: NDArray[Any] = np.array(x.do_slot("x"), dtype=np.float64)
+        case "l":
+            data = np.array(x.do_slot("x"), dtype=np.bool_)
+        case _:  # pattern matrices have no x slot
+            data = np.ones(len(i), dtype=np.bool_)
+
+    if rclass[2] == "C":
+        p = np.array(x.do_slot("p"), dtype=np.int32)
+        out = RSparseArray((data, i, p), shape=shape)
+    else:
+        j = np.array(x.do_slot("j"), dtype=np.int32)
+        out = RSparseArray(scipy.sparse.coo_array((data, (i, j)), shape=shape))
+
+    dimnames = [
+        None if isinstance(names, NULLType) else np.array(names, dtype="U")
+        for names in x.do_slot("Dimnames")
+    ]
+    if any(names is not None for names in dimnames):
+        out._rattributes = {"dimnames": dimnames}
+    return out
+
+
+def convert_pysparsematrix(x: scipy.sparse.sparray | scipy.sparse.spmatrix) -> Any:
+    from .convert_py2r import convert_py2r
+    from .rarray import convert_numpy1D
+    from .rhelpers import rhelpers
 
     try:
-        sparse_matrix: Callable[..., Any] = rcall("Matrix::sparseMatrix")
+        csc = scipy.sparse.csc_array(x)  # no copy if x already is CSC
+        if not csc.has_canonical_format:
+            csc = csc.copy()
+            csc.sum_duplicates()
+
+        data = (
+            csc.data
+            if csc.dtype.kind == "b"
+            else csc.data.astype(np.float64, copy=False)
+        )
+        attributes = getattr(x, "_rattributes", None) or {}
+        dimnames = attributes.get("dimnames", [None, None])
+
+        sparse_matrix: Callable[..., Any] = rhelpers.get("sparse_matrix")
         return sparse_matrix(
-            i=ro.IntVector(x.row + 1),
-            j=ro.IntVector(x.col + 1),
-            x=ro.FloatVector(x.data),
-            dims=ro.IntVector(x.shape),
+            i=convert_numpy1D(csc.indices),
+            p=convert_numpy1D(csc.indptr),
+            x=convert_numpy1D(data),
+            dims=ro.IntVector(csc.shape),
+            dimnames=convert_py2r(list(dimnames)),
         )
     except Exception:
         return x
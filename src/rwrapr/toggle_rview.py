@@ -1,5 +1,7 @@
+from contextlib import AbstractContextManager
 from types import TracebackType
 
+from .settings import Settings
 from .settings import settings
 
 
@@ -9,7 +11,9 @@ class ToggleRView:
 
     This class enables toggling of the Rview setting on entry and exit from
     the context block. It sets the Rview setting to a specified temp_state when
-    entering the block, and reverts it when exiting the block.
+    entering the block, and reverts it when exiting the block. The setting is
+    only changed in the current context (see `Settings.override`), so
+    concurrent threads are not affected.
 
     Attributes:
         temp_state (bool): The temp_state to set for the Rview mode when entering the block.
@@ -23,8 +27,8 @@ class ToggleRView:
             temp_state (bool): The temp_state to set for the Rview mode when entering
                 the context block.
         """
-        self.orig_state = settings.rview_mode
         self.temp_state = temp_state
+        self.override: AbstractContextManager[Settings] | None = None
 
     def __enter__(self) -> None:
         """
@@ -33,7 +37,8 @@ class ToggleRView:
         This method is called automatically when the `with` block is entered,
         and it updates the Rview mode to the given temp_state.
         """
-        settings.set_rview_mode(self.temp_state)
+        self.override = settings.override(rview_mode=self.temp_state)
+        self.override.__enter__()
 
     def __exit__(
         self,
@@ -56,7 +61,9 @@ class ToggleRView:
         Returns:
             bool: If False, the exception is propagated. If True, the exception is suppressed.
         """
-        settings.set_rview_mode(self.orig_state)
+        if self.override is not None:
+            self.override.__exit__(None, None, None)
+            self.override = None
 
         # Check if an exception occurred
         if exc_type is not None:
@@ -0,0 +1,257 @@
+# Per-call tracing of wrapped R functions. When a sink is registered, each
+# call is timed per phase (conversion of the arguments, binding of lazy
+# arguments, the R call, and conversion of the result), and the trace is
+# passed to all sinks. Without sinks, calls are not traced at all. Calls made
+# within a traced call (e.g., by the conversions) are part of its phases, and
+# are not traced themselves.
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+try:
+    from opentelemetry import trace as otel_trace  # type: ignore
+except ImportError:  # pragma: no cover
+    otel_trace = None
+
+
+PHASES: tuple[str, ...] = ("convert_in", "lazy_wrap", "r_call", "convert_out")
+
+
+class CallTrace:
+    """
+    The trace of one call of a wrapped R function.
+
+    Attributes:
+        name (str): The name of the R function, or "<anonymous>".
+        start (int): The start of the call, in nanoseconds since the epoch.
+        phases (dict[str, float]): The duration of each completed phase in seconds, in order.
+        bytes_in (int): The size of the array and data frame arguments, before conversion.
+        bytes_out (int): The size of the array and data frame result, after conversion.
+        error (str | None): The name of the exception raised by the call, if any.
+    """
+
+    def __init__(self, name: str | None) -> None:
+        self.name = name if name else "<anonymous>"
+        self.start = time.time_ns()
+        self.phases: dict[str, float] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.error: str | None = None
+
+    @property
+    def total(self) -> float:
+        """The total duration of the call in seconds."""
+        return sum(self.phases.values())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times the enclosed block as the phase `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{k}={v:.6f}" for k, v in self.phases.items())
+        return f"CallTrace({self.name}: {phases})"
+
+
+Sink = Callable[[CallTrace], Any]
+
+# The registered sinks. The list is modified in place, such that a reference
+# to it can be checked cheaply before tracing a call
+sinks: list[Sink] = []
+
+
+# True within a traced call
+in_traced_call: ContextVar[bool] = ContextVar("rwrapr_in_traced_call", default=False)
+
+
+def add_sink(sink: Sink) -> None:
+    """
+    Registers a sink, called with the `CallTrace` of each call of a wrapped R function.
+
+    Args:
+        sink (Callable[[CallTrace], Any]): The sink, e.g., a callback, an
+            `OpenTelemetrySink` or a `StatsSink`.
+    """
+    if sink not in sinks:
+        sinks.append(sink)
+
+
+def remove_sink(sink: Sink) -> None:
+    """
+    Unregisters a sink. Does nothing if the sink is not registered.
+
+    Args:
+        sink (Callable[[CallTrace], Any]): The sink.
+    """
+    if sink in sinks:
+        sinks.remove(sink)
+
+
+@contextmanager
+def trace_calls(sink: Sink) -> Iterator[Sink]:
+    """
+    Registers a sink for the duration of a with block.
+
+    Args:
+        sink (Callable[[CallTrace], Any]): The sink.
+
+    Yields:
+        Callable[[CallTrace], Any]: The sink.
+    """
+    add_sink(sink)
+    try:
+        yield sink
+    finally:
+        remove_sink(sink)
+
+
+def emit(call_trace: CallTrace) -> None:
+    for sink in list(sinks):
+        sink(call_trace)
+
+
+def nbytes(x: Any) -> int:
+    # The size of the data of arrays and data frames, other objects count as 0
+    match x:
+        case pd.DataFrame():
+            return int(x.memory_usage(index=False).sum())
+        case np.ndarray() | pd.Series():
+            return int(x.nbytes)
+        case _:
+            return 0
+
+
+class StatsSink:
+    """
+    Aggregates traces per R function, see `stats`.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[str, dict[str, float]] = {}
+
+    def __call__(self, call_trace: CallTrace) -> None:
+        row = self._rows.get(call_trace.name)
+        if row is None:
+            row = self._rows[call_trace.name] = dict.fromkeys(
+                ("calls", "errors", *PHASES, "total", "bytes_in", "bytes_out"), 0.0
+            )
+        row["calls"] += 1
+        row["errors"] += call_trace.error is not None
+        for phase, duration in call_trace.phases.items():
+            row[phase] += duration
+        row["total"] += call_trace.total
+        row["bytes_in"] += call_trace.bytes_in
+        row["bytes_out"] += call_trace.bytes_out
+
+    def table(self) -> pd.DataFrame:
+        """
+        Gets the aggregated traces.
+
+        Returns:
+            pd.DataFrame: One row per R function, with the number of calls and
+                errors, the total seconds spent in each phase, and the total bytes
+                converted, sorted by total time.
+        """
+        table = pd.DataFrame.from_dict(self._rows, orient="index")
+        if table.empty:
+            return table
+        table = table.astype(
+            {"calls": int, "errors": int, "bytes_in": int, "bytes_out": int}
+        )
+        return table.sort_values("total", ascending=False)
+
+    def reset(self) -> None:
+        """Discards the aggregated traces."""
+        self._rows.clear()
+
+
+stats_sink: StatsSink = StatsSink()
+
+
+def enable_stats() -> None:
+    """Starts aggregating the traces of all calls of wrapped R functions, see `stats`."""
+    add_sink(stats_sink)
+
+
+def disable_stats() -> None:
+    """Stops aggregating traces. The aggregated traces are kept."""
+    remove_sink(stats_sink)
+
+
+def stats(reset: bool = False) -> pd.DataFrame:
+    """
+    Gets the traces of the calls of wrapped R functions, aggregated per function.
+
+    Traces are only aggregated after `enable_stats()` is called.
+
+    Args:
+        reset (bool): If True, the aggregated traces are discarded afterwards. Defaults to False.
+
+    Returns:
+        pd.DataFrame: One row per R function, with the number of calls and errors,
+            the total seconds spent in each phase, and the total bytes converted.
+    """
+    table = stats_sink.table()
+    if reset:
+        stats_sink.reset()
+    return table
+
+
+class OpenTelemetrySink:
+    """
+    Exports traces as OpenTelemetry spans, with a child span per phase.
+
+    Requires the `opentelemetry-api` package. The spans are exported by the
+    span processors configured for the tracer provider.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        """
+        Initializes the sink.
+
+        Args:
+            tracer (opentelemetry.trace.Tracer | None): The tracer creating the spans.
+                Defaults to the tracer named "rwrapr" of the global tracer provider.
+
+        Raises:
+            ImportError: If `opentelemetry-api` is not installed.
+        """
+        if otel_trace is None:
+            raise ImportError(
+                "OpenTelemetrySink requires the opentelemetry-api package"
+            )
+        self.tracer = tracer if tracer is not None else otel_trace.get_tracer("rwrapr")
+
+    def __call__(self, call_trace: CallTrace) -> None:
+        end = call_trace.start + int(call_trace.total * 1e9)
+        span = self.tracer.start_span(call_trace.name, start_time=call_trace.start)
+        span.set_attribute("rwrapr.bytes_in", call_trace.bytes_in)
+        span.set_attribute("rwrapr.bytes_out", call_trace.bytes_out)
+        if call_trace.error is not None:
+            span.set_attribute("rwrapr.error", call_trace.error)
+            span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR))
+
+        # the phases run one after another
+        context = otel_trace.set_span_in_context(span)
+        phase_start = call_trace.start
+        for phase, duration in call_trace.phases.items():
+            phase_end = phase_start + int(duration * 1e9)
+            child = self.tracer.start_span(
+                phase, context=context, start_time=phase_start
+            )
+            child.end(end_time=phase_end)
+            phase_start = phase_end
+        span.end(end_time=end)
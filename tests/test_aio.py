@@ -0,0 +1,69 @@
+# type: ignore
+import asyncio
+import threading
+from concurrent.futures import CancelledError
+
+import pytest
+
+import rwrapr as wr
+
+
+def test_acall():
+    bs = wr.library("base")
+
+    async def main():
+        return await asyncio.gather(bs.sum.acall(1, 2), bs.paste.acall("a", "b"))
+
+    assert asyncio.run(main()) == [3, "a b"]
+
+
+def test_async_renv():
+    arenv = wr.AsyncRenv(wr.library("base"))
+
+    async def main():
+        x = await arenv.seq_len(4)
+        y = await arenv.reval("1 + 1")
+        return x.tolist(), y
+
+    assert asyncio.run(main()) == ([1, 2, 3, 4], 2)
+
+
+def test_cancel_queued():
+    executor = wr.RExecutor(maxsize=4)
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    running = executor.submit(block)
+    started.wait()
+    queued = executor.submit(lambda: 1)
+
+    assert not running.cancel()  # running calls are not cancelled
+    assert queued.cancel()
+    release.set()
+    executor.shutdown()
+    assert queued.cancelled()
+    with pytest.raises(CancelledError):
+        queued.result()
+
+
+def test_run_backpressure_and_cancel():
+    executor = wr.RExecutor(maxsize=2)
+    release = threading.Event()
+
+    async def main():
+        blocked = [asyncio.create_task(executor.run(release.wait)) for _ in range(2)]
+        waiting = asyncio.create_task(executor.run(lambda: 1))
+        await asyncio.sleep(0.1)
+        assert executor.queue.qsize() <= 1  # the third call is not queued yet
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        release.set()
+        return await asyncio.gather(*blocked, executor.run(lambda: 2))
+
+    assert asyncio.run(main()) == [True, True, 2]
+    executor.shutdown()
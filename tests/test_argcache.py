@@ -0,0 +1,36 @@
+# type: ignore
+import gc
+
+import numpy as np
+import pandas as pd
+
+import rwrapr as wr
+
+
+def test_arg_cache_reuses_conversion():
+    bs = wr.library("base")
+    df = pd.DataFrame({"x": np.arange(1000, dtype=np.float64), "y": np.arange(1000)})
+
+    cache = wr.ArgCache(min_nbytes=0)
+    wr.settings.set_arg_cache(cache)
+    try:
+        assert bs.nrow(df) == 1000
+        assert bs.ncol(df) == 2
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+        df.loc[0, "x"] = -1.0  # modified frames are converted again
+        assert bs.nrow(df) == 1000
+        assert cache.misses == 2
+    finally:
+        wr.settings.set_arg_cache(None)
+
+    del df
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_arg_cache_small_args():
+    cache = wr.ArgCache()
+    assert cache.fingerprint(np.arange(3)) is None
+    assert cache.fingerprint([1, 2, 3]) is None
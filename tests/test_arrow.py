@@ -0,0 +1,94 @@
+# type: ignore
+import numpy as np
+import pandas as pd
+import pytest
+
+import rwrapr as wr
+from rwrapr.rarrow import arrow_available
+
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def bs():
+    bs = wr.library("base")
+    if not arrow_available():
+        pytest.skip("the R package arrow is not installed")
+    return bs
+
+
+def test_arrow_roundtrip(bs):
+    df = pd.DataFrame(
+        {
+            "x": np.arange(5, dtype=np.float64),
+            "n": np.arange(5, dtype=np.int32),
+            "s": list("abcde"),
+            "f": pd.Categorical(list("ababa")),
+        }
+    )
+    out = bs.identity(df)
+
+    assert isinstance(out, pd.DataFrame)
+    assert out.shape == (5, 4)
+    np.testing.assert_array_equal(out["x"], df["x"])
+    assert out["s"].tolist() == df["s"].tolist()
+    assert out["f"].astype(str).tolist() == df["f"].astype(str).tolist()
+
+
+def test_arrow_matches_pandas2ri(bs):
+    from rwrapr.rarrow import arrow_pandas2r
+    from rwrapr.rarrow import arrow_r2pandas
+    from rwrapr.rdataframe import pandas2r
+    from rwrapr.rdataframe import r2pandas
+    from rwrapr.rutils import rcall
+
+    same = rcall(
+        """data.frame(
+            x = c(1, 2.5, NA),
+            n = 1:3,
+            s = c("a", "b", "c"),
+            f = factor(c("u", NA, "v")),
+            o = factor(c("lo", "hi", "lo"), levels = c("lo", "hi"), ordered = TRUE)
+        )"""
+    )
+    differs = rcall(
+        """data.frame(
+            n = c(1L, NA, 3L),
+            d = as.Date(c("2024-01-01", NA, "2024-03-01")),
+            s = c("a", NA, "c")
+        )"""
+    )
+    assert arrow_r2pandas(same) is not None
+    assert arrow_r2pandas(differs) is None  # falls back to pandas2ri
+
+    for rdf in (same, differs):
+        with wr.settings.override(arrow_transfer=True):
+            with_arrow = r2pandas(rdf)
+        with wr.settings.override(arrow_transfer=False):
+            without_arrow = r2pandas(rdf)
+        pd.testing.assert_frame_equal(with_arrow, without_arrow)  # including the index
+
+    identical = rcall("identical")
+    pdf = pd.DataFrame(
+        {
+            "x": [1.0, 2.5, np.nan],
+            "n": np.arange(3, dtype=np.int32),
+            "b": [True, False, True],
+            "s": ["a", "b", "c"],
+            "f": pd.Categorical(["u", None, "v"]),
+        }
+    )
+    assert arrow_pandas2r(pdf) is not None
+    assert arrow_pandas2r(pdf.assign(s=["a", None, "c"])) is None
+
+    with wr.settings.override(arrow_transfer=True):
+        with_arrow = pandas2r(pdf)
+    with wr.settings.override(arrow_transfer=False):
+        without_arrow = pandas2r(pdf)
+    assert identical(with_arrow, without_arrow)[0]  # including the row names
+
+
+def test_arrow_rownames_fallback(bs):
+    mtcars = bs.reval("datasets::mtcars")
+    assert "Mazda RX4" in mtcars.index
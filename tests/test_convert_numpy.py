@@ -0,0 +1,29 @@
+# type: ignore
+import numpy as np
+
+import rwrapr as wr
+
+
+def test_numpy2r():
+    bs = wr.library("base")
+    x = np.arange(12).reshape(3, 4)
+    assert np.all(bs.dim(x) == [3, 4])
+    assert np.all(bs.identity(x) == x)
+    assert np.all(bs.identity(np.asfortranarray(x)) == x)
+    assert bs.typeof(x) == "integer"
+    assert bs.typeof(x.astype(float)) == "double"
+    assert bs.typeof(x > 2) == "logical"
+    assert np.all(bs.identity(x > 2) == (x > 2))
+    assert bs.identity(x)[2, 1] == 9
+
+    y = np.arange(24.0).reshape(2, 3, 4)
+    assert np.all(bs.dim(y) == [2, 3, 4])
+    assert np.all(bs.identity(y) == y)
+    assert np.all(bs.identity(y[:, ::2, 1:]) == y[:, ::2, 1:])
+
+
+def test_numpy2r_object_array_keeps_shape():
+    bs = wr.library("base")
+    x = np.array([["a", 1], ["b", 2]], dtype=object)
+    assert np.all(bs.dim(x) == [2, 2])
+    assert bs.typeof(x) == "character"
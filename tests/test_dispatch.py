@@ -0,0 +1,24 @@
+# type: ignore
+import rwrapr as wr
+from rwrapr import convert_r2py as cr
+from rwrapr.rutils import get_rclass_fast
+
+
+def test_rclass_fast():
+    bs = wr.library("base")
+    x = bs.reval("data.frame(x = 1)", rview=True).to_r()
+    assert get_rclass_fast(x) == ("data.frame",)
+    assert get_rclass_fast(1.0) is None
+
+
+def test_dispatch_cached():
+    bs = wr.library("base")
+    cr._handlers.clear()
+    out = bs.reval("lapply(1:200, function(i) list(a = i, b = letters[i %% 26 + 1]))")
+    assert len(out) == 200
+    assert out[9]["a"] == 10
+    assert out[9]["b"] == "k"
+    assert len(cr._handlers) < 10  # one handler per type and class
+
+    model = bs.reval("stats::lm(y ~ x, data.frame(x = 1:3, y = c(2, 4, 7)))")
+    assert isinstance(model, wr.RView)
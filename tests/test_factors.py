@@ -1,5 +1,6 @@
 # type: ignore
 import numpy as np
+import pandas as pd
 
 import rwrapr as wr
 
@@ -11,3 +12,45 @@ def test_factors():
     assert x._rattributes is None
     assert np.all(attrs["levels"] == ["a", "b", "c"])
     assert attrs["class"] == "factor"
+
+
+def test_factor_codes_and_levels():
+    r = wr.library("base")
+    x = r.factor(["b", "z", "a", "b"], levels=["b", "a", "c"])
+    assert isinstance(x, wr.RFactor)
+    assert x.cat.categories.tolist() == ["b", "a", "c"]
+    assert x.cat.codes.tolist() == [0, -1, 1, 0]
+    assert not x.cat.ordered
+
+    y = r.factor(["lo", "hi"], levels=["lo", "hi"], ordered=True)
+    assert y.cat.ordered
+
+
+def test_categorical_roundtrip():
+    r = wr.library("base")
+    cat = pd.Categorical(["x", None, "y"], categories=["y", "x"], ordered=True)
+    assert r.levels(cat).tolist() == ["y", "x"]
+    assert r.is_ordered(cat)
+    assert r.is_na(cat).tolist() == [False, True, False]
+
+    x = r.identity(pd.Series(cat))
+    assert x.cat.codes.tolist() == [1, -1, 0]
+    assert r.identical(x, cat)
+
+
+def test_categorical_na_roundtrip():
+    r = wr.library("base")
+    cat = pd.Categorical(["a", None, "b", None])
+    assert cat.codes.dtype == np.int8
+
+    x = r.identity(pd.Series(cat))
+    assert r.is_na(cat).tolist() == [False, True, False, True]
+    assert x.isna().tolist() == [False, True, False, True]
+    assert x.cat.categories.tolist() == ["a", "b"]
+
+
+def test_factor_attributes():
+    r = wr.library("base")
+    x = r.reval("structure(factor(c('a', 'b')), label = 'Letters')")
+    assert x._rattributes == {"label": "Letters"}
+    assert r.attr(x, "label") == "Letters"
@@ -0,0 +1,51 @@
+# type: ignore
+import numpy as np
+import pandas as pd
+import pytest
+
+import rwrapr as wr
+
+
+@pytest.fixture(scope="module")
+def df():
+    return pd.DataFrame(
+        {
+            "county": ["a", "a", "b", "b", "b", "c"],
+            "year": [1, 2, 1, 1, 2, 1],
+            "value": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        }
+    )
+
+
+def test_groupby_apply_data_frames(df):
+    bs = wr.library("base")
+    out = bs.subset.groupby_apply(df, by="county", select=["value"])
+    assert isinstance(out, pd.DataFrame)
+    assert out.columns.tolist() == ["county", "value"]
+    assert out["county"].tolist() == ["a", "a", "b", "b", "b", "c"]
+    assert np.all(out["value"] == df["value"])
+
+
+def test_groupby_apply_by_key(df):
+    bs = wr.library("base")
+    fun = bs.function("function(data, scale) sum(data$value) * scale")
+    out = fun.groupby_apply(df, by=["county", "year"], data_arg="data", scale=10)
+    assert out == {
+        ("a", 1): 10.0,
+        ("a", 2): 20.0,
+        ("b", 1): 70.0,
+        ("b", 2): 50.0,
+        ("c", 1): 60.0,
+    }
+
+
+def test_groupby_apply_parallel(df):
+    bs = wr.library("base", workers=2)
+    try:
+        out = bs.nrow.groupby_apply(df, by="county", parallel=True)
+        assert out == {"a": 2, "b": 3, "c": 1}
+    finally:
+        bs.pool.shutdown()
+
+    with pytest.raises(ValueError):
+        wr.library("base").nrow.groupby_apply(df, by="county", parallel=True)
@@ -0,0 +1,34 @@
+# type: ignore
+import pandas as pd
+
+import rwrapr as wr
+
+
+def test_iter_chunks():
+    bs = wr.library("base")
+    rdf = bs.reval(
+        "structure(data.frame(x = 1:10, y = letters[1:10]), note = 'hi')", rview=True
+    )
+
+    chunks = list(wr.RDataFrame.iter_chunks(rdf, rows=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert all(chunk._rattributes["note"] == "hi" for chunk in chunks)
+    assert chunks[0]._rattributes is not chunks[1]._rattributes
+
+    df = pd.concat([chunk.to_py() for chunk in chunks])
+    assert df["x"].tolist() == list(range(1, 11))
+    assert df["y"].tolist() == list("abcdefghij")
+
+
+def test_iter_chunks_index():
+    bs = wr.library("base")
+    rdf = bs.reval("data.frame(x = 1:5, d = as.Date('2024-01-01') + 0:4)", rview=True)
+
+    chunks = list(wr.RDataFrame.iter_chunks(rdf, rows=2))
+    assert [chunk.index.tolist() for chunk in chunks] == [["1", "2"], ["3", "4"], ["5"]]
+    whole = wr.RDataFrame(rdf.to_r())
+    assert pd.concat(chunks).index.equals(whole.index)
+
+    named = bs.reval("data.frame(x = 1:3, row.names = c('a', 'b', 'c'))", rview=True)
+    chunks = list(wr.RDataFrame.iter_chunks(named, rows=2))
+    assert [chunk.index.tolist() for chunk in chunks] == [["a", "b"], ["c"]]
@@ -0,0 +1,26 @@
+# type: ignore
+import numpy as np
+
+import rwrapr as wr
+
+
+def test_keep_per_call():
+    bs = wr.library("base")
+    x = bs.seq_len.keep(10)
+    assert isinstance(x, wr.RView)
+
+    y = bs.rev.keep(x)  # passed to R without conversion
+    assert isinstance(y, wr.RView)
+    assert bs.sum(y) == 55
+    assert y.to_py().tolist() == list(range(10, 0, -1))
+
+
+def test_keep_per_renv():
+    bs = wr.library("base", keep_in_r=True)
+    x = bs.rev(bs.seq_len(6))
+    assert isinstance(x, wr.RView)
+    np.testing.assert_array_equal(x.to_py(), [6, 5, 4, 3, 2, 1])
+    assert bs.sum(x).to_py() == 21
+
+    f = bs.function("function(x) x * 2")
+    assert isinstance(f(2), wr.RView)
@@ -0,0 +1,23 @@
+# type: ignore
+import rwrapr as wr
+from rwrapr.lazy_rexpr import lazy_wrap
+
+
+def test_lazy_closure_is_cached():
+    bs = wr.library("base")
+    first = lazy_wrap([], {"na.rm": wr.Lazily("TRUE")}, bs.sum.func, "sum")
+    second = lazy_wrap([], {"na.rm": wr.Lazily("TRUE")}, bs.sum.func, "sum")
+    assert first is second
+    assert first(1, 2, bs.NA)[0] == 3
+
+    other = lazy_wrap([], {"na.rm": wr.Lazily("FALSE")}, bs.sum.func, "sum")
+    assert other is not first
+
+
+def test_lazy_expressions_keep_order():
+    bs = wr.library("base")
+    dplyr = wr.library("dplyr")
+    df = bs.data_frame(x=[1, 2])
+    for _ in range(2):
+        out = dplyr.mutate(df, y=wr.Lazily("x * 2"), z=wr.Lazily("y + 1"))
+        assert out["z"].tolist() == [3, 5]
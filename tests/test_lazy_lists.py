@@ -0,0 +1,45 @@
+# type: ignore
+import rwrapr as wr
+from rwrapr.rlist import LazyRDict
+from rwrapr.rlist import LazyRList
+
+
+def test_lazy_dict():
+    bs = wr.library("base")
+    with wr.settings.override(lazy_lists=True):
+        out = bs.reval("structure(list(a = 1:3, b = list(c = 'x', 'y')), note = 'hi')")
+
+    assert isinstance(out, LazyRDict)
+    assert list(out) == ["a", "b"]
+    assert "a" in out
+    assert out._converted == {}
+
+    a = out["a"]
+    assert a.tolist() == [1, 2, 3]
+    assert out["a"] is a  # memoised
+    assert "b" not in out._converted
+    assert out._rattributes["note"] == "hi"
+
+    # not forced, so the original R list is passed back
+    assert out.to_r() is out._robj
+    assert bs.length(out) == 2
+
+    py = out.to_py()
+    assert isinstance(py, dict)
+    assert py["b"]["c"] == "x"
+    assert py["b"]["2"] == "y"
+
+
+def test_lazy_list():
+    bs = wr.library("base")
+    with wr.settings.override(lazy_lists=True):
+        out = bs.reval("list(1, 'a', TRUE)")
+
+    assert isinstance(out, LazyRList)
+    assert len(out) == 3
+    assert out[-2] == "a"
+    assert list(out) == [1, "a", True]
+
+    out.append(4)  # modifying converts the whole list
+    assert out.to_py() == [1, "a", True, 4]
+    assert bs.length(out) == 4
@@ -0,0 +1,26 @@
+# type: ignore
+import numpy as np
+import pandas as pd
+
+import rwrapr as wr
+
+
+def test_lazy_functions():
+    st = wr.library("stats", lazy=True)
+    x = np.array([1.0, 2.0, 3.0, 10.0])
+
+    assert st.median(x) == 2.5
+    assert st.median is st.median  # wrapper is cached on the instance
+    assert np.allclose(st.p_adjust([0.01, 0.02], method="bonferroni"), [0.02, 0.04])
+
+
+def test_lazy_datasets():
+    ds = wr.library("datasets", lazy=True)
+    assert isinstance(ds.iris, pd.DataFrame)
+    assert ds.iris.shape == (150, 5)
+
+
+def test_lazy_expression():
+    st = wr.library("stats", lazy=True)
+    df = pd.DataFrame({"x": [1.0, 2.0, 3.0]})
+    assert st.weighted_mean(df["x"], w=wr.Lazily("c(1, 1, 2)")) == 2.25
@@ -0,0 +1,44 @@
+# type: ignore
+import rwrapr as wr
+from rwrapr.manifest import load_manifest
+
+
+def test_manifest_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("RWRAPR_CACHE_DIR", str(tmp_path))
+    assert load_manifest("base", lib_loc=None) is None
+
+    wr.library("base")  # the cache is off by default
+    assert not (tmp_path / "manifests").exists()
+
+    with wr.settings.override(manifest_cache=True):
+        cold = wr.library("base")
+        assert len(list((tmp_path / "manifests").glob("base-*.json"))) == 1
+
+        funcs, _ = load_manifest("base", lib_loc=None)
+        assert "paste" in funcs
+
+        warm = wr.library("base")
+        assert warm.paste("a", "b") == cold.paste("a", "b")
+
+
+def test_manifest_unwritable(tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setenv("RWRAPR_CACHE_DIR", str(blocker))
+
+    with wr.settings.override(manifest_cache=True):
+        bs = wr.library("base")
+    assert bs.sum(1, 2) == 3
+
+
+def test_manifest_r_error(monkeypatch):
+    from rpy2.rinterface_lib.embedded import RRuntimeError
+
+    from rwrapr import manifest
+
+    def failing_package_info(env_name, lib_loc):
+        raise RRuntimeError("cannot read DESCRIPTION")
+
+    monkeypatch.setattr(manifest, "package_info", failing_package_info)
+    assert manifest.load_manifest("base", lib_loc=None) is None
+    manifest.save_manifest("base", None, funcs={"sum"}, datasets=set())
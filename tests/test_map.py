@@ -0,0 +1,41 @@
+# type: ignore
+import numpy as np
+import pytest
+
+import rwrapr as wr
+
+
+def test_map():
+    bs = wr.library("base")
+    out = bs.sum.map([{"x": np.arange(i)} for i in range(5)])
+    assert out == [0, 0, 1, 3, 6]
+
+    out = bs.round.map([{"x": 1.234}, {"x": 5.678}], digits=1)
+    assert out == [1.2, 5.7]
+
+    # R names of keyword arguments
+    out = bs.mean.map([{"x": np.array([1.0, 2.0, np.nan])}], na_rm=True)
+    assert out == [1.5]
+
+
+def test_starmap_chunks():
+    bs = wr.library("base")
+    args = [(i, i + 1) for i in range(10)]
+    assert bs.seq.starmap(args, chunksize=3) == bs.seq.starmap(args)
+    assert bs.paste.starmap([("a", "b"), ("c", "d")], sep="-") == ["a-b", "c-d"]
+    assert bs.paste.starmap([]) == []
+
+
+def test_map_keep_in_r():
+    bs = wr.library("base", keep_in_r=True)
+    out = bs.seq_len.map([{"length_out": 2}, {"length_out": 3}])
+    assert all(isinstance(x, wr.RView) for x in out)
+    assert out[1].to_py().tolist() == [1, 2, 3]
+
+
+def test_map_errors():
+    bs = wr.library("base")
+    with pytest.raises(ValueError):
+        bs.sum.map([{"x": 1}], chunksize=0)
+    with pytest.raises(TypeError):
+        bs.sum.map([{"x": wr.Lazily("1")}])
@@ -0,0 +1,48 @@
+# type: ignore
+import numpy as np
+
+import rwrapr as wr
+from rwrapr.rlist import atomic_kind
+from rwrapr.rlist import fits_rint
+
+
+def test_atomic_kind():
+    assert atomic_kind([True, False]) == "b"
+    assert atomic_kind([1, 2, 3]) == "i"
+    assert atomic_kind([1, 2.5]) == "f"
+    assert atomic_kind(["a", np.str_("b")]) == "U"
+    assert atomic_kind([np.int64(1), 2]) == "i"
+    assert atomic_kind([1, "a"]) is None
+    assert atomic_kind([True, 1]) is None
+    assert atomic_kind([1, None]) is None
+
+
+def test_homogeneous_lists_are_atomic():
+    bs = wr.library("base")
+    assert bs.typeof([1, 2, 3]) == "integer"
+    assert bs.typeof([1, 2.5]) == "double"
+    assert bs.typeof([True, False]) == "logical"
+    assert bs.typeof(["a", "b"]) == "character"
+    assert bs.sum(list(range(100_000))) == sum(range(100_000))
+
+
+def test_large_ints_are_not_rintegers():
+    assert fits_rint(np.array([-(2**31) + 1, 2**31 - 1]))
+    assert not fits_rint(np.array([1, 2**31]))
+    assert not fits_rint(np.array([-(2**31)]))  # NA in R
+
+    bs = wr.library("base")
+    assert bs.length([1, 2**40]) == 2
+
+
+def test_heterogeneous_lists_are_rlists():
+    bs = wr.library("base")
+    assert bs.typeof([1, "a"]) == "list"
+    assert bs.typeof([]) == "list"
+    assert bs.length([1, "a", None]) == 3
+    assert bs.names([1, "a"]) is None
+
+    out = bs.identity([1, "a", [2, 3]])
+    assert out[0] == 1
+    assert out[1] == "a"
+    assert out[2].tolist() == [2, 3]
@@ -0,0 +1,51 @@
+# type: ignore
+import rwrapr as wr
+
+
+def make_counter():
+    bs = wr.library("base")
+    bs.reval("rwrapr_calls <- 0")
+    f = bs.function("function(x) { rwrapr_calls <<- rwrapr_calls + 1; x * 2 }")
+    return bs, f
+
+
+def test_memoize_context():
+    bs, f = make_counter()
+
+    with wr.Memoize() as cache:
+        assert f(2) == 4
+        assert f(2) == 4
+        assert f(3) == 6
+
+    assert cache.hits == 1
+    assert cache.misses == 2
+    assert bs.reval("rwrapr_calls") == 2
+
+    f(2)  # outside the block calls are not memoized
+    assert bs.reval("rwrapr_calls") == 3
+
+
+def test_memoize_renv(tmp_path):
+    bs = wr.library("base")
+    bs.reval("rwrapr_calls <- 0")
+    bs.reval("slow_double <- function(x) { rwrapr_calls <<- rwrapr_calls + 1; x * 2 }")
+
+    cache = bs.memoize("slow_double", cache_dir=tmp_path)
+    assert bs.slow_double(2) == 4
+    assert bs.slow_double(2) == 4
+    assert bs.reval("rwrapr_calls") == 1
+    assert len(list(tmp_path.glob("*.rds"))) == 1
+
+    cache.clear()  # results are read back from disk
+    assert bs.slow_double(2) == 4
+    assert bs.reval("rwrapr_calls") == 1
+
+
+def test_memoize_maxsize():
+    _, f = make_counter()
+    cache = wr.RCallCache(maxsize=2)
+    with wr.Memoize(cache):
+        f(1)
+        f(2)
+        f(3)
+    assert len(cache) == 2
@@ -0,0 +1,22 @@
+# type: ignore
+import rwrapr as wr
+from rwrapr.rhelpers import rhelpers
+
+
+def test_rhelpers_compiled_once():
+    bs = wr.library("base")
+    x = bs.c(a=1, b=2)
+
+    f = rhelpers.get("attributes")
+    assert rhelpers.get("attributes") is f
+    assert rhelpers.wrapped("class") is rhelpers.wrapped("class")
+    assert x._rattributes["names"].tolist() == ["a", "b"]
+    assert rhelpers.get("attributes") is f
+
+    rhelpers.clear()
+    assert rhelpers.get("attributes") is not f
+
+
+def test_rhelpers_register():
+    rhelpers.register("double_it", "function(x) x * 2")
+    assert rhelpers.wrapped("double_it")(2) == 4
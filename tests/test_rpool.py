@@ -0,0 +1,43 @@
+# type: ignore
+import numpy as np
+import pandas as pd
+import pytest
+from rpy2.rinterface_lib.embedded import RRuntimeError
+
+import rwrapr as wr
+
+
+def test_submit():
+    st = wr.library("stats", workers=2)
+    try:
+        futures = [st.median.submit(np.arange(n, dtype=np.float64)) for n in (3, 5, 8)]
+        assert [f.result(timeout=60) for f in futures] == [1.0, 2.0, 3.5]
+
+        df = pd.DataFrame({"x": [1.0, 2.0], "y": ["a", "b"]})
+        out = st.setNames.submit(df, ["u", "v"]).result(timeout=60)
+        assert list(out.columns) == ["u", "v"]
+    finally:
+        st.pool.shutdown()
+
+
+def test_submit_error():
+    st = wr.library("stats", workers=1)
+    try:
+        with pytest.raises(RRuntimeError, match="boom"):
+            st.stop.submit("boom").result(timeout=60)
+    finally:
+        st.pool.shutdown()
+
+
+def test_submit_without_pool():
+    bs = wr.library("base")
+    with pytest.raises(ValueError):
+        bs.sum.submit(1, 2)
+
+
+def test_close_pool():
+    with wr.library("stats", workers=1) as st:
+        assert st.median.submit(np.arange(3, dtype=np.float64)).result(timeout=60) == 1
+    with pytest.raises(RuntimeError):
+        st.median.submit(np.arange(3, dtype=np.float64))
+    st.close()  # closing again does nothing
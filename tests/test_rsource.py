@@ -0,0 +1,51 @@
+# type: ignore
+import os
+
+import rwrapr as wr
+from rwrapr.rsource import rsources
+from rwrapr.rsource import script_function
+
+
+def test_script_function():
+    source = script_function("x <- 1", ["x", "y"])
+    assert source == "function() {\nx <- 1\nlist(x=x, y=y)\n}"
+
+
+def test_function_is_parsed_once():
+    bs = wr.library("base")
+    f = bs.function("function(x) x + 1")
+    g = bs.function("function(x) x + 1")
+    assert f.func is g.func
+    assert g(1) == 2
+
+    h = bs.function("function(x) x + 1", bytecompile=True)
+    assert h.func is not f.func
+    assert h(2) == 3
+
+
+def test_function_is_evaluated_unless_definition():
+    bs = wr.library("base")
+    bs.reval("rwrapr_test_f <- function() 1")
+    assert bs.function("rwrapr_test_f")() == 1
+    bs.reval("rwrapr_test_f <- function() 2")
+    assert bs.function("rwrapr_test_f")() == 2
+
+    counter = "local({n <- 0; function() n <<- n + 1})"
+    assert bs.function(counter)() == 1
+    assert bs.function(counter)() == 1
+
+
+def test_rscript_is_reread_when_changed(tmp_path):
+    bs = wr.library("base")
+    path = tmp_path / "script.R"
+    path.write_text("x <- 1")
+    assert bs.rscript(path=path, extract=["x"])["x"] == 1
+
+    source = rsources.script(path, ["x"])
+    assert rsources.script(path, ["x"]) is source
+
+    path.write_text("x <- 22")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert bs.rscript(path=path, extract=["x"])["x"] == 22
+    assert bs.rscript(path=str(path), extract=["x"], bytecompile=True)["x"] == 22
@@ -0,0 +1,60 @@
+# type: ignore
+import threading
+
+import pytest
+
+import rwrapr as wr
+
+
+def test_override():
+    assert not wr.settings.rview_mode
+    with wr.settings.override(rview_mode=True, zero_copy=True):
+        assert wr.settings.rview_mode
+        assert wr.settings.zero_copy
+    assert not wr.settings.rview_mode
+    assert not wr.settings.zero_copy
+
+    with pytest.raises(AttributeError):
+        with wr.settings.override(not_a_setting=True):
+            pass
+
+
+def test_override_is_context_local():
+    inside = threading.Event()
+    release = threading.Event()
+    seen = []
+
+    def convert():
+        with wr.ToggleRView(True):
+            inside.set()
+            release.wait()
+
+    thread = threading.Thread(target=convert)
+    thread.start()
+    inside.wait()
+    seen.append(wr.settings.rview_mode)  # not affected by the other thread
+    release.set()
+    thread.join()
+
+    assert seen == [False]
+
+
+def test_set_is_process_wide():
+    seen = []
+    wr.settings.set_rview_mode(True)
+    try:
+        thread = threading.Thread(target=lambda: seen.append(wr.settings.rview_mode))
+        thread.start()
+        thread.join()
+    finally:
+        wr.settings.set_rview_mode(False)
+    assert seen == [True]
+
+
+def test_executor_uses_caller_context():
+    bs = wr.library("base")
+    executor = wr.RExecutor()
+    with wr.settings.override(rview_mode=True):
+        result = executor.submit(bs.sum, 1, 2).result()
+    executor.shutdown()
+    assert isinstance(result, wr.RView)
@@ -0,0 +1,41 @@
+# type: ignore
+import numpy as np
+import scipy
+
+import rwrapr as wr
+
+
+def test_sparse_roundtrip():
+    bs = wr.library("base")
+    mat = wr.library("Matrix")
+
+    m = mat.sparseMatrix(
+        i=np.array([1, 3, 4]),
+        j=np.array([1, 2, 3]),
+        x=np.array([1.5, 2.0, 3.0]),
+        dims=np.array([4, 3]),
+        dimnames=bs.list(bs.c("a", "b", "c", "d"), bs.c("A", "B", "C")),
+    )
+    assert isinstance(m, wr.RSparseArray)
+    assert m.shape == (4, 3)
+    assert m[2, 1] == 2.0
+    assert m.nnz == 3
+    assert np.all(m._rattributes["dimnames"][1] == ["A", "B", "C"])
+    assert np.all(bs.colnames(m) == ["A", "B", "C"])
+    assert bs.sum(m) == 6.5
+
+    back = bs.identity(m)
+    assert isinstance(back, wr.RSparseArray)
+    assert np.all(back.toarray() == m.toarray())
+
+    dense = np.array([[0.0, 1.0], [2.0, 0.0], [0.0, 0.0]])
+    for sparse in (
+        scipy.sparse.csr_array(dense),
+        scipy.sparse.csc_matrix(dense),
+        scipy.sparse.coo_array(dense),
+    ):
+        assert np.all(bs.identity(sparse).toarray() == dense)
+
+    pattern = mat.sparseMatrix(i=np.array([1, 2]), j=np.array([2, 1]), dims=np.array([2, 2]))
+    assert pattern.dtype == np.bool_
+    assert pattern[0, 1]
@@ -29,3 +29,26 @@ def test_subsetting_rarray():
     assert np.all(
         arr[np.sum(arr, axis=1) > 20, :]._rattributes["dimnames"][1] == ["A", "B", "C"]
     )
+
+
+def test_subsetting_rarray_shares_names():
+    bs = wr.library("base")
+    arr = bs.matrix(
+        np.arange(12) + 1,
+        nrow=4,
+        ncol=3,
+        dimnames=bs.list(bs.c("a", "b", "c", "d"), bs.c("A", "B", "C")),
+    )
+    rownames, colnames = arr._rattributes["dimnames"]
+    assert not rownames.flags.writeable
+
+    # rows share the column names, and slices of the row names are views
+    row = arr[1, :]
+    assert len(row._rattributes["dimnames"]) == 1
+    assert np.shares_memory(row._rattributes["dimnames"][0], colnames)
+    assert np.shares_memory(arr[1:3, :]._rattributes["dimnames"][0], rownames)
+
+    # subsetting does not modify the attributes of the original
+    assert arr._rattributes["dimnames"][0] is rownames
+    assert arr._rattributes["dim"].tolist() == [4, 3]
+    assert np.all(bs.rownames(arr[1:3, :].to_r()) == ["b", "c"])
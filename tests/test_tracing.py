@@ -0,0 +1,58 @@
+# type: ignore
+import numpy as np
+import pytest
+from rpy2.rinterface_lib.embedded import RRuntimeError
+
+import rwrapr as wr
+from rwrapr.tracing import sinks
+
+
+def test_trace_calls():
+    bs = wr.library("base")
+    traces = []
+    with wr.trace_calls(traces.append):
+        bs.sum(np.arange(10.0))
+        with pytest.raises(RRuntimeError):
+            bs.stop("boom")
+    assert not sinks
+
+    assert [t.name for t in traces] == ["sum", "stop"]
+    assert list(traces[0].phases) == [
+        "convert_in",
+        "lazy_wrap",
+        "r_call",
+        "convert_out",
+    ]
+    assert traces[0].bytes_in == 80
+    assert traces[0].error is None
+    assert traces[1].error is not None
+    assert "convert_out" not in traces[1].phases
+
+
+def test_stats():
+    bs = wr.library("base")
+    wr.stats(reset=True)
+    wr.enable_stats()
+    try:
+        for _ in range(3):
+            bs.rnorm(100)
+    finally:
+        wr.disable_stats()
+    bs.rnorm(100)  # not traced
+
+    table = wr.stats(reset=True)
+    assert table.loc["rnorm", "calls"] == 3
+    assert table.loc["rnorm", "bytes_out"] == 3 * 800
+    assert table.loc["rnorm", "total"] >= table.loc["rnorm", "r_call"]
+    assert wr.stats().empty
+
+
+def test_helpers_not_traced():
+    from rwrapr.rhelpers import rhelpers
+
+    bs = wr.library("base")
+    traces = []
+    with wr.trace_calls(traces.append):
+        rhelpers.wrapped("object_size")(np.arange(10.0))
+        bs.identity(np.arange(10.0))
+    assert [t.name for t in traces] == ["identity"]
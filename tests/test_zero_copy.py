@@ -0,0 +1,24 @@
+# type: ignore
+import numpy as np
+
+import rwrapr as wr
+
+
+def test_zero_copy():
+    bs = wr.library("base")
+    wr.settings.set_zero_copy(True)
+    try:
+        m = bs.matrix(np.arange(12.0), nrow=4)
+        assert m.flags.f_contiguous
+        assert not m.flags.writeable
+        assert m[1, 2] == 9
+        assert np.all(m[1:, :2].to_py() == np.arange(12.0).reshape(3, 4).T[1:, :2])
+        assert bs.sum(m) == 66
+
+        x = bs.c(1, 2, 3)
+        assert not x.flags.writeable
+        assert x.copy().flags.writeable
+    finally:
+        wr.settings.set_zero_copy(False)
+
+    assert bs.matrix(np.arange(12.0), nrow=4).flags.c_contiguous